@@ -4,6 +4,11 @@ Financial Analysis Configuration
 Centralized configuration for database connection and analysis parameters.
 """
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
 # =============================================================================
 # DATABASE CONNECTION SETTINGS
 # =============================================================================
@@ -11,7 +16,51 @@ SERVER = 'DESKTOP-UCV0E2C'
 DATABASE = 'ParsonsFinanceSim'
 DRIVER = 'SQL Server'
 
-# Connection string template
+# ODBC driver-manager connection pooling, so repeated connects during an
+# extraction reuse open sessions. On Linux this depends on unixODBC; set to
+# False for unixODBC < 2.3.12, where pooling is unreliable.
+CONNECTION_POOL_ENABLED = True
+
+# Read extracts through ConnectorX (Rust, writes straight into column buffers)
+# when it is installed; falls back to pyodbc otherwise
+USE_CONNECTORX = False
+
+@lru_cache(maxsize=1)
+def get_connectorx_url():
+    return f'mssql://{SERVER}/{DATABASE}?trusted_connection=true'
+
+# Read extracts through turbodbc, which fetches result sets straight into Arrow
+# columns instead of per-row Python tuples. Used when ConnectorX is not.
+USE_TURBODBC = False
+
+# Local Parquet cache of extract_all results, revalidated against a cheap
+# row-count / last-modified probe. Only Invoices tracks modifications, so
+# in-place edits to the other tables are not detected; keep off unless the
+# dimension tables are append-only.
+EXTRACT_CACHE_ENABLED = False
+EXTRACT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.parsons_cache')
+
+# Seconds an extract_* result is reused by the same engine instance before
+# re-querying (0 disables; ParsonsDataEngine.refresh() clears it early)
+EXTRACT_MEMO_TTL = 300
+
+# Engine-side connection pool shared by the extract_* calls of extract_all
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 8
+
+# Split the invoices extract into this many InvoiceDate ranges, fetched in
+# parallel on separate connections (1 = a single query)
+INVOICE_PARTITIONS = 1
+
+# Rows fetched per round trip when streaming extracts from the server
+EXTRACT_CHUNKSIZE = 65536
+
+# Default fetch batch size for ad-hoc engine cursors
+CURSOR_ARRAYSIZE = 10000
+
+# Connection string template (cached; call get_connection_string.cache_clear()
+# after changing the settings above at runtime)
+@lru_cache(maxsize=1)
 def get_connection_string():
     return (
         f'DRIVER={{{DRIVER}}};'
@@ -24,28 +73,58 @@ def get_connection_string():
 # AGING BUCKET CONFIGURATION
 # =============================================================================
 # Define the boundaries for aging buckets (in days)
-AGING_BUCKETS = [0, 30, 60, 90, float('inf')]
-BUCKET_LABELS = ['Current (0-30)', '31-60 Days', '61-90 Days', '90+ Days (Toxic)']
+AGING_BUCKETS: Final = (0, 30, 60, 90, float('inf'))
+BUCKET_LABELS: Final = ('Current (0-30)', '31-60 Days', '61-90 Days', '90+ Days (Toxic)')
+
+# =============================================================================
+# DATA CLEANING SETTINGS
+# =============================================================================
+SOURCE_DATE_FORMAT = '%Y-%m-%d'  # Expected format of raw date columns
+
+# Compact dtypes applied to cleaned columns (only once they have no gaps)
+DTYPES: Final = MappingProxyType({
+    'DaysOverdue': 'int32',
+    'DaysSinceLogged': 'int32',
+    'PaymentTerms': 'int16'
+})
+
+# Clean the extracted tables concurrently (pandas kernels release the GIL)
+CLEAN_PARALLEL = True
+CLEAN_MAX_WORKERS = 4
+
+# Extraction keys that share the unbilled-work cleaner; when several point at
+# the same raw DataFrame it is cleaned once and the result reused
+WIP_ALIASES = ('unbilled_work', 'wip_summary')
+
+# Set to 'pyarrow' to store ID columns of the cleaned tables as Arrow int64,
+# so joins across tables run on Arrow-backed keys (None keeps NumPy dtypes)
+CLEAN_DTYPE_BACKEND = None
+
+# Parquet cache of cleaned tables, keyed by a hash of the full raw extract,
+# the cleaning settings above and the cleaner code. Opt-in: writes to cache/
+CLEAN_CACHE_ENABLED = False
+CLEAN_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+CLEAN_CACHE_MAX_ENTRIES = 20  # Least recently used files are pruned beyond this
 
 # =============================================================================
 # CLIENT RISK GRADING THRESHOLDS
 # =============================================================================
 # Based on average days variance from contractual terms
-RISK_GRADE_THRESHOLDS = {
+RISK_GRADE_THRESHOLDS: Final = MappingProxyType({
     'A': 10,      # Excellent: ≤10 days variance
     'B': 20,      # Good: 11-20 days variance
     'C': 40,      # Watch: 21-40 days variance
     'D': 60,      # At Risk: 41-60 days variance
     'F': float('inf')  # Default Risk: 61+ days variance
-}
+})
 
-RISK_GRADE_DESCRIPTIONS = {
+RISK_GRADE_DESCRIPTIONS: Final = MappingProxyType({
     'A': 'Excellent - Consistent early/on-time payments',
     'B': 'Good - Minor delays, low risk',
     'C': 'Watch - Moderate delays, needs monitoring',
     'D': 'At Risk - Significant delays, escalation needed',
     'F': 'Default Risk - Chronic late payments, collection action required'
-}
+})
 
 # =============================================================================
 # PREDICTIVE ANALYTICS SETTINGS
@@ -53,6 +132,7 @@ RISK_GRADE_DESCRIPTIONS = {
 FORECAST_PERIODS = 4  # Quarters to forecast ahead
 CONFIDENCE_INTERVAL = 0.95  # 95% confidence interval
 MOVING_AVERAGE_WINDOW = 3  # Months for moving average calculation
+FORECAST_TYPES = ('Historical', 'Forecast')  # Row labels of the forecast 'Type' column
 
 # =============================================================================
 # WIP ANALYSIS SETTINGS
@@ -71,29 +151,41 @@ AR_SNAPSHOT_PREFIX = 'AR_Snapshot'
 RISK_REPORT_PREFIX = 'Risk_Report'
 WIP_REPORT_PREFIX = 'WIP_Leakage_Report'
 EXECUTIVE_SUMMARY_PREFIX = 'Executive_Summary'
+COMBINED_REPORT_PREFIX = 'Financial_Report'
+
+# CSV snapshot writer: 'pandas', or 'pyarrow' for Arrow's C++ writer. The
+# pyarrow output quotes strings and writes lowercase booleans; frames it
+# cannot encode (e.g. Period columns) fall back to pandas.
+CSV_ENGINE = 'pandas'
+CSV_CHUNKSIZE = 100_000
 
 # =============================================================================
 # VISUALIZATION SETTINGS
 # =============================================================================
 CHART_STYLE = 'seaborn-v0_8-whitegrid'
 FIGURE_DPI = 100
-COLOR_PALETTE = {
+
+# Render the report charts in worker processes (Agg backend)
+CHART_PARALLEL = True
+CHART_WORKERS = 4
+
+COLOR_PALETTE: Final = MappingProxyType({
     'current': '#2ecc71',      # Green
     'warning': '#f39c12',      # Orange
     'danger': '#e74c3c',       # Red
     'severe': '#8e44ad',       # Purple
     'primary': '#3498db',      # Blue
     'secondary': '#95a5a6'     # Gray
-}
+})
 
 # Colors for aging buckets
-AGING_COLORS = ['#2ecc71', '#f39c12', '#e74c3c', '#8e44ad']
+AGING_COLORS: Final = ('#2ecc71', '#f39c12', '#e74c3c', '#8e44ad')
 
 # Colors for risk grades
-RISK_GRADE_COLORS = {
+RISK_GRADE_COLORS: Final = MappingProxyType({
     'A': '#27ae60',
     'B': '#2ecc71',
     'C': '#f39c12',
     'D': '#e67e22',
     'F': '#c0392b'
-}
+})
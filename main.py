@@ -6,17 +6,10 @@ Parsons Simulation: Optimizing the Cash Conversion Cycle
 One-click execution script for automated financial analysis.
 Connects to SQL Server, extracts data, runs analysis, and generates reports.
 """
-from src.data_engine import ParsonsDataEngine
-from src.data_cleaning import DataCleaner
-from src.dso_analysis import DSOAnalyzer
-from src.wip_analysis import WIPAnalyzer
-from src.risk_scoring import RiskScorer
-from src.predictive_analytics import PredictiveAnalyzer
-from src.visualizations import FinancialVisualizer
-from src.report_generator import ReportGenerator
-
 import sys
 import os
+import logging
+import multiprocessing as mp
 from datetime import datetime
 
 # Add project root to path
@@ -38,14 +31,35 @@ def print_header():
     print("=" * 70 + "\n")
 
 
+def _render_chart(task):
+    """Render one chart in a worker process (module-level so it can be pickled)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from src.visualizations import FinancialVisualizer
+    
+    method, args, save_path = task
+    fig = getattr(FinancialVisualizer(), method)(*args, save_path=save_path)
+    plt.close(fig)
+    return save_path
+
+
 def run_analysis():
     """Execute the complete financial analysis pipeline."""
+    # Imported here so the header prints before pandas/matplotlib load
+    from src.data_engine import ParsonsDataEngine
+    from src.data_cleaning import DataCleaner
+    from src.dso_analysis import DSOAnalyzer
+    from src.wip_analysis import WIPAnalyzer
+    from src.risk_scoring import RiskScorer
+    from src.predictive_analytics import PredictiveAnalyzer
+    from src.visualizations import FinancialVisualizer
+    from src.report_generator import ReportGenerator
 
     # Initialize components
     engine = ParsonsDataEngine()
     cleaner = DataCleaner()
     reporter = ReportGenerator()
-    visualizer = FinancialVisualizer()
     
     # Step 1: Test connection
     print("[1/7] Testing database connection...")
@@ -138,36 +152,36 @@ def run_analysis():
     # Generate visualizations
     reports_dir = config.REPORTS_DIR
     timestamp = datetime.now().strftime(config.DATE_FORMAT)
-    
-    # Core visualizations
-    visualizer.plot_aging_buckets(aging_summary, 
-                                   save_path=os.path.join(reports_dir, f'aging_chart_{timestamp}.png'))
-    visualizer.plot_dso_trend(dso_trend,
-                               save_path=os.path.join(reports_dir, f'dso_trend_{timestamp}.png'))
-    visualizer.plot_wip_leakage(wip_by_project,
-                                 save_path=os.path.join(reports_dir, f'wip_leakage_{timestamp}.png'))
-    visualizer.plot_client_grades(grade_distribution,
-                                   save_path=os.path.join(reports_dir, f'risk_grades_{timestamp}.png'))
-    
-    # Predictive Analytics visualizations
-    visualizer.plot_trend_with_bars(trend_data,
-                                     save_path=os.path.join(reports_dir, f'trend_analysis_{timestamp}.png'))
-    visualizer.plot_forecast_combined(forecast_data,
-                                       save_path=os.path.join(reports_dir, f'forecast_bars_{timestamp}.png'))
-    visualizer.plot_forecast_line(forecast_data,
-                                   save_path=os.path.join(reports_dir, f'forecast_line_{timestamp}.png'))
-    visualizer.plot_predictive_dashboard(trend_data, forecast_data, at_risk_clients,
-                                          save_path=os.path.join(reports_dir, f'predictive_dashboard_{timestamp}.png'))
+    os.makedirs(reports_dir, exist_ok=True)
+    
+    def chart_path(name):
+        return os.path.join(reports_dir, f'{name}_{timestamp}.png')
+    
+    chart_tasks = [
+        # Core visualizations
+        ('plot_aging_buckets', (aging_summary,), chart_path('aging_chart')),
+        ('plot_dso_trend', (dso_trend,), chart_path('dso_trend')),
+        ('plot_wip_leakage', (wip_by_project,), chart_path('wip_leakage')),
+        ('plot_client_grades', (grade_distribution,), chart_path('risk_grades')),
+        # Predictive Analytics visualizations
+        ('plot_trend_with_bars', (trend_data,), chart_path('trend_analysis')),
+        ('plot_forecast_combined', (forecast_data,), chart_path('forecast_bars')),
+        ('plot_forecast_line', (forecast_data,), chart_path('forecast_line')),
+        ('plot_predictive_dashboard', (trend_data, forecast_data, at_risk_clients),
+         chart_path('predictive_dashboard')),
+    ]
+    
+    workers = min(config.CHART_WORKERS, len(chart_tasks), os.cpu_count() or 1)
+    if config.CHART_PARALLEL and workers > 1:
+        with mp.Pool(processes=workers) as pool:
+            pool.map(_render_chart, chart_tasks)
+    else:
+        # Only the serial path needs matplotlib in this process
+        FinancialVisualizer().render_batch(chart_tasks)
     
     print(f"   📊 Visualizations saved to {reports_dir}/")
-    print(f"      - aging_chart_{timestamp}.png")
-    print(f"      - dso_trend_{timestamp}.png")
-    print(f"      - wip_leakage_{timestamp}.png")
-    print(f"      - risk_grades_{timestamp}.png")
-    print(f"      - trend_analysis_{timestamp}.png")
-    print(f"      - forecast_bars_{timestamp}.png")
-    print(f"      - forecast_line_{timestamp}.png")
-    print(f"      - predictive_dashboard_{timestamp}.png")
+    for _, _, save_path in chart_tasks:
+        print(f"      - {os.path.basename(save_path)}")
     
     print("\n" + "=" * 70)
     print("✅ ANALYSIS COMPLETE!")
@@ -177,6 +191,7 @@ def run_analysis():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
     print_header()
     
     success = run_analysis()
@@ -2,26 +2,37 @@
 Financial Analysis Source Package
 =================================
 Modules for data extraction, cleaning, analysis, and reporting.
+
+Classes are imported lazily on first access so that importing the package
+does not pull in pyodbc or matplotlib until they are needed.
 """
 
-from .data_engine import ParsonsDataEngine
-from .data_cleaning import DataCleaner
-from .dso_analysis import DSOAnalyzer
-from .wip_analysis import WIPAnalyzer
-from .risk_scoring import RiskScorer
-from .predictive_analytics import PredictiveAnalyzer
-from .visualizations import FinancialVisualizer
-from .report_generator import ReportGenerator
-
-__all__ = [
-    'ParsonsDataEngine',
-    'DataCleaner',
-    'DSOAnalyzer',
-    'WIPAnalyzer',
-    'RiskScorer',
-    'PredictiveAnalyzer',
-    'FinancialVisualizer',
-    'ReportGenerator'
-]
+import importlib
+
+_LAZY_IMPORTS = {
+    'ParsonsDataEngine': '.data_engine',
+    'DataCleaner': '.data_cleaning',
+    'DSOAnalyzer': '.dso_analysis',
+    'WIPAnalyzer': '.wip_analysis',
+    'RiskScorer': '.risk_scoring',
+    'PredictiveAnalyzer': '.predictive_analytics',
+    'FinancialVisualizer': '.visualizations',
+    'ReportGenerator': '.report_generator'
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
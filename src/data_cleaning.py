@@ -8,13 +8,68 @@ Handles null values, type conversions, and calculated fields.
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Optional
 import sys
 import os
+import glob
+import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+# PyArrow string kernels are used for text normalization when available
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+# Aging bucket edges and labels, prepared once for vectorized bucketing
+_AGING_BINS = np.asarray(config.AGING_BUCKETS, dtype=float)
+_AGING_DTYPE = pd.CategoricalDtype(config.BUCKET_LABELS, ordered=True)
+
+# Period ordinal used by pandas for NaT
+_NAT_ORDINAL = np.iinfo(np.int64).min
+
+# Parquet schema metadata key holding each cached column's cleaned dtype
+_CACHE_DTYPES_KEY = b'cleaned_dtypes'
+
+
+@lru_cache(maxsize=1)
+def _cleaner_source_crc() -> int:
+    """CRC32 of this module's source, so cache files die with any cleaner change."""
+    with open(__file__, 'rb') as fh:
+        return zlib.crc32(fh.read())
+
+
+def _cleaning_settings() -> str:
+    """The config values that shape cleaned output, as a stable string."""
+    return repr((config.AGING_BUCKETS, config.BUCKET_LABELS, sorted(config.DTYPES.items()),
+                 config.SOURCE_DATE_FORMAT, config.CLEAN_DTYPE_BACKEND, pd.__version__))
+
+
+def _dtype_spec(dtype):
+    """JSON-safe description of a dtype that _spec_dtype turns back into it."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {'categories': _dtype_spec(dtype.categories.dtype), 'ordered': bool(dtype.ordered)}
+    if isinstance(dtype, pd.StringDtype) and dtype.na_value is pd.NA:
+        return f'string[{dtype.storage}]'
+    return str(dtype)
+
+
+def _restore_dtype(series: pd.Series, spec) -> pd.Series:
+    """Cast a column read back from Parquet to the dtype it was cleaned to."""
+    if isinstance(spec, dict):
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype('category')
+        categories = series.cat.categories.astype(pd.api.types.pandas_dtype(spec['categories']))
+        return series.astype(pd.CategoricalDtype(categories, ordered=spec['ordered']))
+    dtype = pd.api.types.pandas_dtype(spec)
+    return series if series.dtype == dtype else series.astype(dtype)
+
 
 class DataCleaner:
     """
@@ -22,7 +77,113 @@ class DataCleaner:
     """
     
     @staticmethod
-    def clean_invoices(df: pd.DataFrame) -> pd.DataFrame:
+    def _parse_dates(df: pd.DataFrame, columns: list, 
+                     fmt: Optional[str] = None) -> pd.DataFrame:
+        """
+        Parse date columns using an explicit format.
+        
+        An explicit format lets pandas use its vectorized parser instead of
+        inferring the format element by element. Columns that do not match
+        the format fall back to mixed-format parsing.
+        
+        Args:
+            df: DataFrame containing the date columns
+            columns: Date column names (missing columns are skipped)
+            fmt: strftime format of the raw values (defaults to config.SOURCE_DATE_FORMAT)
+            
+        Returns:
+            DataFrame with parsed datetime64 columns
+        """
+        fmt = fmt or config.SOURCE_DATE_FORMAT
+        
+        for col in columns:
+            if col not in df.columns or pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue
+            try:
+                df[col] = pd.to_datetime(df[col], format=fmt)
+            except (ValueError, TypeError):
+                df[col] = pd.to_datetime(df[col], format='mixed', errors='coerce')
+        
+        return df
+    
+    @staticmethod
+    def _coerce_numeric(df: pd.DataFrame, columns: list,
+                        fill_values: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Convert columns to numeric in a single batched pass.
+        
+        Columns already typed numeric by the extract are left untouched.
+        
+        Args:
+            df: DataFrame containing the numeric columns
+            columns: Column names to convert (missing columns are skipped)
+            fill_values: Optional mapping of column -> value for missing entries
+            
+        Returns:
+            DataFrame with numeric columns
+        """
+        present = [col for col in columns if col in df.columns]
+        if not present:
+            return df
+        
+        untyped = [col for col in present if not pd.api.types.is_numeric_dtype(df[col])]
+        if untyped:
+            df[untyped] = df[untyped].apply(pd.to_numeric, errors='coerce')
+        
+        if fill_values:
+            df = df.fillna({col: val for col, val in fill_values.items() if col in present})
+        
+        return df
+    
+    @staticmethod
+    def _downcast(df: pd.DataFrame, dtypes: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Cast cleaned columns to compact dtypes.
+        
+        Columns that still contain missing values keep their float dtype.
+        
+        Args:
+            df: Cleaned DataFrame
+            dtypes: Mapping of column -> dtype (defaults to config.DTYPES)
+            
+        Returns:
+            DataFrame with downcast columns
+        """
+        dtypes = dtypes or config.DTYPES
+        casts = {
+            col: dtype for col, dtype in dtypes.items()
+            if col in df.columns and df[col].notna().all()
+        }
+        return df.astype(casts) if casts else df
+    
+    @staticmethod
+    def _as_text(series: pd.Series) -> pd.Series:
+        """
+        Prepare a text column for normalization.
+        
+        Converts to the PyArrow string dtype when pyarrow is installed so that
+        strip/title/upper run in Arrow's compute kernels; otherwise the column
+        is returned unchanged.
+        """
+        if ARROW_STRING_DTYPE is None:
+            return series
+        return series.astype(ARROW_STRING_DTYPE)
+    
+    @staticmethod
+    def _normalize_text(series: pd.Series) -> pd.Series:
+        """
+        Strip and title-case a text column.
+        
+        Args:
+            series: Raw text column
+            
+        Returns:
+            Normalized text column
+        """
+        return DataCleaner._as_text(series).str.strip().str.title()
+    
+    @staticmethod
+    def clean_invoices(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Clean and prepare invoice data for analysis.
         
@@ -34,124 +195,126 @@ class DataCleaner:
         
         Args:
             df: Raw invoices DataFrame
+            copy: Clean a copy of df; False lets the cleaner overwrite df's
+                columns (use the returned frame either way)
             
         Returns:
             Cleaned DataFrame with proper types and calculated fields
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
         # Parse date columns
-        date_columns = ['InvoiceDate', 'DueDate', 'PaidDate']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-        
-        # Ensure numeric columns
-        numeric_columns = ['InvoiceAmount', 'DaysOverdue', 'DaysToCollect', 
-                          'PaymentTerms', 'CreditLimit']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        df = DataCleaner._parse_dates(df, ['InvoiceDate', 'DueDate', 'PaidDate'])
         
-        # Fill missing DaysOverdue for non-overdue items
-        if 'DaysOverdue' in df.columns:
-            df['DaysOverdue'] = df['DaysOverdue'].fillna(0)
+        # Ensure numeric columns; fill missing DaysOverdue for non-overdue items
+        df = DataCleaner._coerce_numeric(
+            df,
+            ['InvoiceAmount', 'DaysOverdue', 'DaysToCollect', 'PaymentTerms', 'CreditLimit'],
+            fill_values={'DaysOverdue': 0}
+        )
         
         # Standardize status values
         if 'Status' in df.columns:
-            df['Status'] = df['Status'].str.strip().str.title()
+            df['Status'] = DataCleaner._as_text(df['Status']).str.strip().str.title().astype('category')
+        
+        df = DataCleaner._downcast(df)
         
         # Add calculated fields
-        df = DataCleaner.add_calculated_fields(df)
+        df = DataCleaner.add_calculated_fields(df, copy=False)
         
         return df
     
     @staticmethod
-    def clean_clients(df: pd.DataFrame) -> pd.DataFrame:
+    def clean_clients(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Clean and standardize client data.
         
         Args:
             df: Raw clients DataFrame
+            copy: Clean a copy of df; False lets the cleaner overwrite df's
+                columns (use the returned frame either way)
             
         Returns:
             Cleaned DataFrame
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
-        # Standardize client names
+        # Standardize client names (categorical only when names repeat often)
         if 'ClientName' in df.columns:
-            df['ClientName'] = df['ClientName'].str.strip().str.title()
+            df['ClientName'] = DataCleaner._normalize_text(df['ClientName'])
+            if df['ClientName'].nunique() < 0.5 * len(df):
+                df['ClientName'] = df['ClientName'].astype('category')
         
         # Ensure numeric columns
-        if 'CreditLimit' in df.columns:
-            df['CreditLimit'] = pd.to_numeric(df['CreditLimit'], errors='coerce').fillna(0)
-        
-        if 'PaymentTerms' in df.columns:
-            df['PaymentTerms'] = pd.to_numeric(df['PaymentTerms'], errors='coerce').fillna(30)
+        df = DataCleaner._coerce_numeric(
+            df, ['CreditLimit', 'PaymentTerms'],
+            fill_values={'CreditLimit': 0, 'PaymentTerms': 30}
+        )
         
-        return df
+        return DataCleaner._downcast(df)
     
     @staticmethod
-    def clean_projects(df: pd.DataFrame) -> pd.DataFrame:
+    def clean_projects(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Clean and normalize project data.
         
         Args:
             df: Raw projects DataFrame
+            copy: Clean a copy of df; False lets the cleaner overwrite df's
+                columns (use the returned frame either way)
             
         Returns:
             Cleaned DataFrame with standardized categories
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
         # Parse date columns
-        date_columns = ['StartDate', 'EndDate']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+        df = DataCleaner._parse_dates(df, ['StartDate', 'EndDate'])
         
         # Standardize categorical columns
         if 'Sector' in df.columns:
-            df['Sector'] = df['Sector'].str.strip().str.title()
+            df['Sector'] = DataCleaner._normalize_text(df['Sector']).astype('category')
         
         if 'Region' in df.columns:
-            df['Region'] = df['Region'].str.strip().str.upper()
+            df['Region'] = DataCleaner._as_text(df['Region']).str.strip().str.upper().astype('category')
         
         # Ensure budget is numeric
-        if 'Budget' in df.columns:
-            df['Budget'] = pd.to_numeric(df['Budget'], errors='coerce').fillna(0)
+        df = DataCleaner._coerce_numeric(df, ['Budget'], fill_values={'Budget': 0})
         
-        return df
+        return DataCleaner._downcast(df)
     
     @staticmethod
-    def clean_unbilled_work(df: pd.DataFrame) -> pd.DataFrame:
+    def clean_unbilled_work(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Clean WIP/unbilled work data.
         
         Args:
             df: Raw unbilled work DataFrame
+            copy: Clean a copy of df; False lets the cleaner overwrite df's
+                columns (use the returned frame either way)
             
         Returns:
             Cleaned DataFrame
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
         # Parse date column
-        if 'LogDate' in df.columns:
-            df['LogDate'] = pd.to_datetime(df['LogDate'], errors='coerce')
+        df = DataCleaner._parse_dates(df, ['LogDate'])
         
         # Ensure numeric values
-        if 'EstimatedValue' in df.columns:
-            df['EstimatedValue'] = pd.to_numeric(df['EstimatedValue'], errors='coerce').fillna(0)
-        
-        if 'DaysSinceLogged' in df.columns:
-            df['DaysSinceLogged'] = pd.to_numeric(df['DaysSinceLogged'], errors='coerce').fillna(0)
+        df = DataCleaner._coerce_numeric(
+            df, ['EstimatedValue', 'DaysSinceLogged'],
+            fill_values={'EstimatedValue': 0, 'DaysSinceLogged': 0}
+        )
         
-        return df
+        return DataCleaner._downcast(df)
     
     @staticmethod
-    def add_calculated_fields(df: pd.DataFrame) -> pd.DataFrame:
+    def add_calculated_fields(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Add calculated fields to invoice data.
         
@@ -164,37 +327,48 @@ class DataCleaner:
         
         Args:
             df: Invoice DataFrame
+            copy: Add the fields to a copy of df instead of df itself
             
         Returns:
             DataFrame with additional calculated columns
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         
-        # Aging Bucket calculation
+        # Aging Bucket calculation (right-closed bins, e.g. 30 -> Current)
         if 'DaysOverdue' in df.columns:
-            df['AgingBucket'] = pd.cut(
-                df['DaysOverdue'],
-                bins=config.AGING_BUCKETS,
-                labels=config.BUCKET_LABELS,
-                include_lowest=True,
-                right=True
-            )
+            days = df['DaysOverdue'].to_numpy(dtype=float, na_value=np.nan)
+            codes = np.searchsorted(_AGING_BINS, days, side='left') - 1
             
-            # Handle negative values (not yet due)
-            mask_not_due = df['DaysOverdue'] <= 0
-            df.loc[mask_not_due, 'AgingBucket'] = config.BUCKET_LABELS[0]
+            # Negative values (not yet due) fall into the current bucket
+            codes = np.clip(codes, 0, len(config.BUCKET_LABELS) - 1)
+            codes[np.isnan(days)] = -1
+            df['AgingBucket'] = pd.Categorical.from_codes(codes, dtype=_AGING_DTYPE)
         
-        # Overdue flag
+        # Overdue flag (compare category codes rather than every row's string)
         if 'Status' in df.columns:
-            df['IsOverdue'] = df['Status'].str.lower() == 'overdue'
+            if isinstance(df['Status'].dtype, pd.CategoricalDtype):
+                categories = df['Status'].cat.categories
+                overdue_codes = [i for i, cat in enumerate(categories) if str(cat).lower() == 'overdue']
+                df['IsOverdue'] = np.isin(df['Status'].cat.codes.to_numpy(), overdue_codes)
+            else:
+                df['IsOverdue'] = df['Status'].str.lower() == 'overdue'
         elif 'DaysOverdue' in df.columns:
             df['IsOverdue'] = df['DaysOverdue'] > 0
         
-        # Time period columns for analysis
+        # Time period columns for analysis, derived from one month-ordinal pass
         if 'InvoiceDate' in df.columns:
-            df['MonthYear'] = df['InvoiceDate'].dt.to_period('M')
-            df['Quarter'] = df['InvoiceDate'].dt.to_period('Q')
-            df['Year'] = df['InvoiceDate'].dt.year
+            dates = df['InvoiceDate'].to_numpy(dtype='datetime64[ns]')
+            nat = np.isnat(dates)
+            months = dates.astype('datetime64[M]').astype(np.int64)  # months since 1970-01
+            years = months // 12
+            quarters = years * 4 + (months % 12) // 3
+            
+            df['MonthYear'] = pd.arrays.PeriodArray(
+                np.where(nat, _NAT_ORDINAL, months), dtype=pd.PeriodDtype('M'))
+            df['Quarter'] = pd.arrays.PeriodArray(
+                np.where(nat, _NAT_ORDINAL, quarters), dtype=pd.PeriodDtype('Q'))
+            df['Year'] = np.where(nat, np.nan, years + 1970) if nat.any() else (years + 1970).astype(np.int32)
         
         # Payment variance (actual days vs terms)
         if 'DaysToCollect' in df.columns and 'PaymentTerms' in df.columns:
@@ -203,55 +377,194 @@ class DataCleaner:
         return df
     
     @staticmethod
-    def clean_all(data: dict) -> dict:
+    def _to_arrow_keys(df: pd.DataFrame) -> pd.DataFrame:
         """
-        Clean all data in the extraction dictionary.
+        Store integer ID columns as Arrow-backed int64.
+        
+        Only the join keys are converted; measures, dates and categoricals keep
+        the NumPy dtypes the analyzers rely on.
         
         Args:
-            data: Dictionary from ParsonsDataEngine.extract_all()
+            df: Cleaned DataFrame
             
         Returns:
-            Dictionary with all DataFrames cleaned
+            DataFrame with Arrow-backed ID columns
         """
-        cleaned = {}
+        keys = {col: 'int64[pyarrow]' for col in df.columns
+                if col.endswith('ID') and pd.api.types.is_integer_dtype(df[col])}
+        return df.astype(keys) if keys else df
+    
+    @staticmethod
+    def _fingerprint(name: str, df: pd.DataFrame) -> str:
+        """
+        Fingerprint of a raw table used as its cache key.
+        
+        Every column is hashed, so any change to the source data misses the cache,
+        as does any change to this module or to the config that drives cleaning.
         
-        if 'invoices' in data:
-            cleaned['invoices'] = DataCleaner.clean_invoices(data['invoices'])
+        Args:
+            name: Table name from the extraction dictionary
+            df: Raw DataFrame
+            
+        Returns:
+            Hex string identifying the raw data and cleaning version
+        """
+        crc = zlib.crc32(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        crc = zlib.crc32(f"{_cleaner_source_crc()}|{_cleaning_settings()}|{name}|{len(df)}|"
+                         f"{'|'.join(map(str, df.columns))}".encode(), crc)
+        return f"{crc:08x}"
+    
+    @staticmethod
+    def _clean_cached(name: str, cleaner, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Load a cleaned table from the Parquet cache, cleaning and storing it on a miss.
         
-        if 'clients' in data:
-            cleaned['clients'] = DataCleaner.clean_clients(data['clients'])
+        Parquet does not round-trip every pandas dtype (string categories,
+        datetime units), so each column's cleaned dtype is stored in the file's
+        schema metadata and restored on load. Falls back to a plain clean when
+        Parquet support is unavailable.
         
-        if 'projects' in data:
-            cleaned['projects'] = DataCleaner.clean_projects(data['projects'])
+        Args:
+            name: Table name from the extraction dictionary
+            cleaner: Cleaning function for the table
+            df: Raw DataFrame
+            
+        Returns:
+            Cleaned DataFrame
+        """
+        path = os.path.join(config.CLEAN_CACHE_DIR,
+                            f"{name}_{DataCleaner._fingerprint(name, df)}.parquet")
+        try:
+            if os.path.exists(path):
+                import pyarrow.parquet as pq
+                specs = json.loads((pq.read_schema(path).metadata or {})[_CACHE_DTYPES_KEY])
+                cleaned = pd.read_parquet(path)
+                cleaned = cleaned.assign(**{col: _restore_dtype(cleaned[col], spec)
+                                            for col, spec in specs.items()})
+                os.utime(path)  # Mark as recently used
+                return cleaned
+        except (ImportError, OSError, ValueError, TypeError, KeyError):
+            pass
+        
+        cleaned = cleaner(df)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(cleaned)
+            specs = json.dumps({col: _dtype_spec(dtype) for col, dtype in cleaned.dtypes.items()})
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                   _CACHE_DTYPES_KEY: specs.encode()})
+            os.makedirs(config.CLEAN_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.tmp'
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+        except (ImportError, OSError, ValueError, TypeError, NotImplementedError):
+            pass
+        return cleaned
+    
+    @staticmethod
+    def _prune_cache(max_entries: Optional[int] = None) -> None:
+        """
+        Remove the least recently used cache files beyond the size cap.
         
-        if 'unbilled_work' in data:
-            cleaned['unbilled_work'] = DataCleaner.clean_unbilled_work(data['unbilled_work'])
+        Args:
+            max_entries: Number of files to keep (defaults to config.CLEAN_CACHE_MAX_ENTRIES)
+        """
+        max_entries = config.CLEAN_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        files = sorted(glob.glob(os.path.join(config.CLEAN_CACHE_DIR, '*.parquet')),
+                       key=os.path.getmtime, reverse=True)
+        for path in files[max_entries:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def clean_all(data: dict, use_cache: Optional[bool] = None) -> dict:
+        """
+        Clean all data in the extraction dictionary.
         
-        if 'wip_summary' in data:
-            cleaned['wip_summary'] = DataCleaner.clean_unbilled_work(data['wip_summary'])
+        Args:
+            data: Dictionary from ParsonsDataEngine.extract_all()
+            use_cache: Reuse cleaned tables cached as Parquet when the raw data
+                is unchanged (defaults to config.CLEAN_CACHE_ENABLED)
+            
+        Returns:
+            Dictionary with all DataFrames cleaned
+        """
+        if use_cache is None:
+            use_cache = config.CLEAN_CACHE_ENABLED
+        
+        cleaners = {
+            'invoices': DataCleaner.clean_invoices,
+            'clients': DataCleaner.clean_clients,
+            'projects': DataCleaner.clean_projects,
+            'unbilled_work': DataCleaner.clean_unbilled_work,
+            'wip_summary': DataCleaner.clean_unbilled_work
+        }
+        # WIP aliases holding the very same raw frame are cleaned only once
+        aliases = {}
+        for key in config.WIP_ALIASES:
+            if key in data:
+                source = next((k for k in config.WIP_ALIASES
+                               if k in data and data[k] is data[key]), key)
+                if source != key:
+                    aliases[key] = source
+        
+        # Cleaners replace whole columns, so a shallow copy keeps the raw
+        # extraction untouched without duplicating its data
+        tasks = {key: (partial(fn, copy=False), data[key].copy(deep=False))
+                 for key, fn in cleaners.items() if key in data and key not in aliases}
+        
+        to_arrow = config.CLEAN_DTYPE_BACKEND == 'pyarrow' and ARROW_STRING_DTYPE is not None
+        
+        def run(key, fn, df):
+            df = DataCleaner._clean_cached(key, fn, df) if use_cache else fn(df)
+            return DataCleaner._to_arrow_keys(df) if to_arrow else df
+        
+        if config.CLEAN_PARALLEL and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=config.CLEAN_MAX_WORKERS) as ex:
+                futures = {key: ex.submit(run, key, fn, df) for key, (fn, df) in tasks.items()}
+                cleaned = {key: fut.result() for key, fut in futures.items()}
+        else:
+            cleaned = {key: run(key, fn, df) for key, (fn, df) in tasks.items()}
+        
+        for key, source in aliases.items():
+            cleaned[key] = cleaned[source]
+        
+        if use_cache:
+            DataCleaner._prune_cache()
         
         return cleaned
     
     @staticmethod
-    def validate_data_quality(df: pd.DataFrame, name: str = 'DataFrame') -> dict:
+    def validate_data_quality(df: pd.DataFrame, name: str = 'DataFrame',
+                              subset: Optional[list] = None,
+                              deep: bool = True) -> dict:
         """
         Perform data quality checks and return a report.
         
         Args:
             df: DataFrame to validate
             name: Name for reporting
+            subset: Key columns checked for duplicates (defaults to whole rows)
+            deep: Measure the true size of string columns (False counts only
+                the pointers held by object columns, which is faster)
             
         Returns:
             Dictionary with quality metrics
         """
+        nulls = df.isna().sum()
+        total = len(df)
+        
         report = {
             'name': name,
-            'total_rows': len(df),
+            'total_rows': total,
             'total_columns': len(df.columns),
-            'null_counts': df.isnull().sum().to_dict(),
-            'null_percentage': (df.isnull().sum() / len(df) * 100).round(2).to_dict(),
-            'duplicate_rows': df.duplicated().sum(),
-            'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024
+            'null_counts': nulls.to_dict(),
+            'null_percentage': (nulls / total * 100).round(2).to_dict(),
+            'duplicate_rows': df.duplicated(subset=subset).sum(),
+            'memory_usage_mb': df.memory_usage(deep=deep).sum() / 1024 / 1024
         }
         
         return report
@@ -280,7 +593,7 @@ if __name__ == "__main__":
     print(sample_invoices)
     print(f"\nData Types:\n{sample_invoices.dtypes}")
     
-    cleaned = DataCleaner.clean_invoices(sample_invoices)
+    cleaned = DataCleaner.clean_invoices(sample_invoices, copy=True)
     
     print("\n" + "=" * 60)
     print("Cleaned Data:")
@@ -5,10 +5,16 @@ SQL Server data extraction for the Parsons Finance Simulation database.
 Provides high-performance ETL from SQL to pandas DataFrames.
 """
 
+import logging
+import numpy as np
 import pyodbc
 import pandas as pd
-from datetime import datetime
-from typing import Optional, Dict
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterator, Union, Callable, Tuple
 import sys
 import os
 
@@ -16,6 +22,159 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+log = logging.getLogger(__name__)
+
+# ConnectorX is an optional, faster read path for the extracts
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+# turbodbc is a second optional read path, fetching result sets as Arrow tables
+try:
+    import turbodbc
+except ImportError:
+    turbodbc = None
+
+# Must be set before the first connection is opened
+pyodbc.pooling = config.CONNECTION_POOL_ENABLED
+
+# SQL INT keys fit in int32. Money stays float64: float32 keeps only ~7
+# significant digits, which loses cents on portfolio-level totals.
+_KEY = 'int32'
+
+# Tables (and their last-change column) whose state each extract depends on
+_WATERMARK_SOURCES = {
+    'invoices': (('Invoices', 'COALESCE(LastModifiedDate, CreatedDate)'),
+                 ('Clients', 'CreatedDate'), ('Projects', 'CreatedDate')),
+    'clients': (('Clients', 'CreatedDate'),),
+    'projects': (('Projects', 'CreatedDate'),),
+    'unbilled_work': (('UnbilledWork', 'CreatedDate'), ('Projects', 'CreatedDate')),
+    'wip_summary': (('UnbilledWork', 'CreatedDate'), ('Projects', 'CreatedDate'))
+}
+
+# Extracts with GETDATE()-relative columns, which go stale at midnight
+_DAILY_EXTRACTS = {'invoices', 'unbilled_work'}
+
+
+def _memoize(ttl: Optional[float] = None) -> Callable:
+    """
+    Cache an extract method's result on the engine instance for ttl seconds.
+    
+    Results are keyed by method name and arguments, ignoring the connection.
+    Chunked and date-range reads are never cached. The cached DataFrame is
+    shared between callers, so treat it as read-only.
+    
+    Args:
+        ttl: Seconds a result stays fresh (defaults to config.EXTRACT_MEMO_TTL)
+        
+    Returns:
+        Decorator for ParsonsDataEngine extract methods
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            max_age = config.EXTRACT_MEMO_TTL if ttl is None else ttl
+            if not max_age or kwargs.get('iter_chunks') or kwargs.get('date_range') is not None:
+                return method(self, *args, **kwargs)
+            
+            key = (method.__name__, args,
+                   tuple(sorted((k, v) for k, v in kwargs.items() if k != 'conn')))
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < max_age:
+                return hit[1]
+            
+            result = method(self, *args, **kwargs)
+            self._cache[key] = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
+
+
+class ConnectionPool:
+    """
+    Small thread-safe pool of pyodbc connections.
+    
+    Connections are created on demand up to max_size and handed back to an
+    idle stack on release, so a batch of extracts pays for at most a few logins.
+    """
+    
+    def __init__(self, factory: Callable[[], pyodbc.Connection],
+                 min_size: Optional[int] = None, max_size: Optional[int] = None):
+        """
+        Initialize the pool and open the minimum number of connections.
+        
+        Args:
+            factory: Callable returning a new connection
+            min_size: Connections opened up front (defaults to config.POOL_MIN_SIZE)
+            max_size: Upper bound on open connections (defaults to config.POOL_MAX_SIZE)
+        """
+        self._factory = factory
+        self._max_size = max_size or config.POOL_MAX_SIZE
+        self._idle = []  # Last in, first out: reuse the most recently used connection
+        self._cond = threading.Condition()
+        self._created = 0
+        
+        min_size = config.POOL_MIN_SIZE if min_size is None else min_size
+        for _ in range(min(min_size, self._max_size)):
+            self._created += 1
+            self._idle.append(self._open())
+    
+    def _open(self) -> pyodbc.Connection:
+        """Open a connection for a slot already counted in _created."""
+        try:
+            return self._factory()
+        except BaseException:
+            self._free_slot()
+            raise
+    
+    def _free_slot(self) -> None:
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+    
+    def _discard(self, conn: pyodbc.Connection) -> None:
+        self._free_slot()
+        try:
+            conn.close()
+        except pyodbc.Error:
+            pass
+    
+    @contextmanager
+    def connection(self) -> Iterator[pyodbc.Connection]:
+        """
+        Borrow a connection for the duration of a with-block.
+        
+        Blocks when max_size connections are already in use, until one is
+        returned or discarded. A connection that raised an error is closed
+        rather than returned to the pool.
+        """
+        with self._cond:
+            while not self._idle and self._created >= self._max_size:
+                self._cond.wait()
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._created += 1  # Reserve the slot before the (slow) login
+        if conn is None:
+            conn = self._open()
+        
+        try:
+            yield conn
+        except Exception:
+            self._discard(conn)
+            raise
+        else:
+            with self._cond:
+                self._idle.append(conn)
+                self._cond.notify()
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+
 
 class ParsonsDataEngine:
     """
@@ -28,27 +187,72 @@ class ParsonsDataEngine:
     - UnbilledWork (WIP tracking)
     """
     
-    def __init__(self, server: str = None, database: str = None):
+    def __init__(self, server: str = None, database: str = None, parallel: bool = True):
         """
         Initialize the data engine with connection parameters.
         
         Args:
             server: SQL Server instance name (defaults to config.SERVER)
             database: Database name (defaults to config.DATABASE)
+            parallel: Run the extracts of extract_all concurrently, one pooled
+                connection per query
         """
         self.server = server or config.SERVER
         self.database = database or config.DATABASE
         self.conn_str = config.get_connection_string()
-        self._connection = None
+        self.parallel = parallel
+        self._pool = None
+        self._cache: Dict[tuple, Tuple[float, pd.DataFrame]] = {}
         
     def get_connection(self) -> pyodbc.Connection:
         """
         Establishes and returns a SQL Server connection.
         
+        The engine only reads, so the connection runs in autocommit mode to
+        skip implicit transaction handling.
+        
         Returns:
             pyodbc.Connection: Active database connection
         """
-        return pyodbc.connect(self.conn_str)
+        return pyodbc.connect(self.conn_str, autocommit=True)
+    
+    @staticmethod
+    def _make_cursor(conn: pyodbc.Connection, arraysize: Optional[int] = None) -> pyodbc.Cursor:
+        """
+        Create a cursor tuned for bulk transfer.
+        
+        Args:
+            conn: Open database connection
+            arraysize: Rows per fetch round trip (defaults to config.CURSOR_ARRAYSIZE)
+            
+        Returns:
+            pyodbc.Cursor with arraysize and fast_executemany set
+        """
+        cursor = conn.cursor()
+        cursor.arraysize = arraysize or config.CURSOR_ARRAYSIZE
+        cursor.fast_executemany = True
+        return cursor
+    
+    def connection_pool(self) -> ConnectionPool:
+        """
+        Returns the engine's connection pool, creating it on first use.
+        
+        Returns:
+            ConnectionPool: Pool of connections to this engine's database
+        """
+        if self._pool is None:
+            self._pool = ConnectionPool(self.get_connection)
+        return self._pool
+    
+    def refresh(self) -> None:
+        """Drop memoized extract results so the next calls re-query SQL."""
+        self._cache.clear()
+    
+    def close(self) -> None:
+        """Close any pooled connections held by the engine."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
     
     def test_connection(self) -> bool:
         """
@@ -59,39 +263,165 @@ class ParsonsDataEngine:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._make_cursor(conn)
                 cursor.execute("SELECT 1")
                 return True
         except Exception as e:
-            print(f"Connection failed: {e}")
+            log.warning("Connection failed: %s", e)
             return False
     
-    def extract_invoices(self) -> pd.DataFrame:
+    def _read_chunked(self, query: str, conn: Optional[pyodbc.Connection] = None,
+                      chunksize: Optional[int] = None,
+                      parse_dates: Optional[list] = None,
+                      dtype: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a query result as DataFrame chunks from a server-side cursor.
+        
+        Args:
+            query: SQL query to execute
+            conn: Open connection to use (a new one is opened and closed if None)
+            chunksize: Rows per chunk (defaults to config.EXTRACT_CHUNKSIZE)
+            parse_dates: Columns to convert to datetime64
+            dtype: Column -> dtype mapping applied to each chunk
+            
+        Yields:
+            DataFrame per fetched batch (a single empty frame if no rows match)
+        """
+        chunksize = chunksize or config.EXTRACT_CHUNKSIZE
+        
+        def to_frame(rows, columns):
+            chunk = pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+            for col in parse_dates or []:
+                chunk[col] = pd.to_datetime(chunk[col])
+            return chunk.astype(dtype) if dtype else chunk
+        
+        owns_conn = conn is None
+        if owns_conn:
+            conn = self.get_connection()
+        cursor = self._make_cursor(conn, arraysize=chunksize)
+        try:
+            cursor.execute(query)
+            columns = [col[0] for col in cursor.description]
+            
+            # The first batch is always yielded so empty results keep their columns
+            rows = cursor.fetchmany(chunksize)
+            yield to_frame(rows, columns)
+            while rows:
+                rows = cursor.fetchmany(chunksize)
+                if rows:
+                    yield to_frame(rows, columns)
+        finally:
+            cursor.close()
+            if owns_conn:
+                conn.close()
+    
+    def _read_turbodbc(self, query: str) -> pd.DataFrame:
+        """
+        Run a query through turbodbc and fetch the whole result as Arrow.
+        
+        Args:
+            query: SQL query to execute
+            
+        Returns:
+            DataFrame built from the fetched Arrow table
+        """
+        options = turbodbc.make_options(prefer_unicode=True, autocommit=True)
+        conn = turbodbc.connect(connection_string=self.conn_str, turbodbc_options=options)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            table = cursor.fetchallarrow()
+        finally:
+            conn.close()
+        # Arrow buffers are released column by column as pandas takes them over
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+    
+    def _read(self, query: str, conn: Optional[pyodbc.Connection] = None,
+              parse_dates: Optional[list] = None,
+              dtype: Optional[dict] = None,
+              iter_chunks: bool = False) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a query, returning either the chunk generator or one concatenated frame.
+        
+        With config.USE_CONNECTORX set and connectorx installed, whole-frame
+        reads go through ConnectorX on its own connection instead of pyodbc;
+        failing that, config.USE_TURBODBC routes them through turbodbc.
+        
+        Args:
+            query: SQL query to execute
+            conn: Open connection to use (a new one is opened if None)
+            parse_dates: Columns to convert to datetime64
+            dtype: Column -> dtype mapping
+            iter_chunks: Return the chunk generator instead of a single DataFrame
+            
+        Returns:
+            DataFrame, or an iterator of DataFrames when iter_chunks is True
+        """
+        df = None
+        if not iter_chunks:
+            if config.USE_CONNECTORX and cx is not None:
+                df = cx.read_sql(config.get_connectorx_url(), query, return_type='pandas')
+            elif config.USE_TURBODBC and turbodbc is not None:
+                df = self._read_turbodbc(query)
+        
+        if df is not None:
+            for col in parse_dates or []:
+                df[col] = pd.to_datetime(df[col])
+            return df.astype(dtype) if dtype else df
+        
+        chunks = self._read_chunked(query, conn=conn, parse_dates=parse_dates, dtype=dtype)
+        if iter_chunks:
+            return chunks
+        return pd.concat(list(chunks), ignore_index=True)
+    
+    @_memoize()
+    def extract_invoices(self, conn: Optional[pyodbc.Connection] = None,
+                         iter_chunks: bool = False,
+                         partition_num: Optional[int] = None,
+                         date_range: Optional[Tuple[str, str]] = None) -> pd.DataFrame:
         """
         Extracts full invoices data with client and project joins.
         
+        Args:
+            conn: Open connection to reuse (a new one is opened if None)
+            iter_chunks: Return a generator of DataFrame chunks instead of one frame
+            partition_num: Split the read into this many InvoiceDate ranges
+                fetched in parallel (defaults to config.INVOICE_PARTITIONS)
+            date_range: Only read invoices with start <= InvoiceDate < end,
+                as 'YYYYMMDD' strings
+            
         Returns:
             DataFrame with columns:
             - InvoiceID, ClientID, ClientName, ProjectID, ProjectName
             - InvoiceAmount, InvoiceDate, DueDate, PaidDate, Status
-            - DaysOverdue (calculated)
+            - IsOpen (unpaid status flag), DaysOverdue (calculated)
         """
-        query = """
+        partition_num = partition_num or config.INVOICE_PARTITIONS
+        if partition_num > 1 and date_range is None and not iter_chunks:
+            return self._extract_invoices_partitioned(partition_num, conn)
+        
+        where = ''
+        if date_range is not None:
+            where = f"WHERE i.InvoiceDate >= '{date_range[0]}' AND i.InvoiceDate < '{date_range[1]}'"
+        
+        query = f"""
         SELECT 
             i.InvoiceID,
             i.ClientID,
             c.ClientName,
             c.PaymentTerms,
-            c.CreditLimit,
+            CAST(c.CreditLimit AS FLOAT) as CreditLimit,
             i.ProjectID,
             p.ProjectName,
             p.Sector,
             p.Region,
-            i.InvoiceAmount,
+            CAST(i.InvoiceAmount AS FLOAT) as InvoiceAmount,
             i.InvoiceDate,
             i.DueDate,
             i.PaidDate,
             i.Status,
+            CAST(CASE WHEN i.Status IN ('Pending', 'Overdue', 'Outstanding')
+                      THEN 1 ELSE 0 END AS BIT) as IsOpen,
             DATEDIFF(day, i.DueDate, GETDATE()) as DaysOverdue,
             CASE 
                 WHEN i.PaidDate IS NOT NULL 
@@ -101,15 +431,66 @@ class ParsonsDataEngine:
         FROM Invoices i
         JOIN Clients c ON i.ClientID = c.ClientID
         JOIN Projects p ON i.ProjectID = p.ProjectID
+        {where}
         ORDER BY i.InvoiceDate DESC
         """
-        with self.get_connection() as conn:
-            return pd.read_sql(query, conn)
+        return self._read(
+            query,
+            parse_dates=['InvoiceDate', 'DueDate', 'PaidDate'],
+            dtype={'InvoiceID': _KEY, 'ClientID': _KEY, 'ProjectID': _KEY,
+                   'InvoiceAmount': 'float64', 'DaysOverdue': 'int32', 'IsOpen': 'bool'},
+            conn=conn, iter_chunks=iter_chunks
+        )
     
-    def extract_clients(self) -> pd.DataFrame:
+    def _extract_invoices_partitioned(self, partition_num: int,
+                                      conn: Optional[pyodbc.Connection] = None) -> pd.DataFrame:
+        """
+        Read the invoices extract as InvoiceDate ranges fetched in parallel.
+        
+        Each range runs on its own connection (cheap with ODBC pooling on).
+        Ranges are concatenated newest first, so the result keeps the
+        InvoiceDate DESC order of a single query.
+        
+        Args:
+            partition_num: Number of date ranges to split the table into
+            conn: Open connection used for the MIN/MAX bounds probe
+            
+        Returns:
+            DataFrame with the same columns and dtypes as extract_invoices
+        """
+        probe = "SELECT MIN(InvoiceDate), MAX(InvoiceDate) FROM Invoices"
+        if conn is None:
+            with self.get_connection() as probe_conn:
+                low, high = self._make_cursor(probe_conn).execute(probe).fetchone()
+        else:
+            low, high = self._make_cursor(conn).execute(probe).fetchone()
+        if low is None:
+            return self.extract_invoices(conn=conn, partition_num=1)
+        
+        # Day-aligned, half-open ranges covering [MIN, MAX + 1 day)
+        first = pd.Timestamp(low).normalize()
+        days = (pd.Timestamp(high).normalize() - first).days + 1
+        edges = np.unique(np.linspace(0, days, partition_num + 1).round().astype(int))
+        bounds = [(first + pd.Timedelta(days=int(d))).strftime('%Y%m%d') for d in edges]
+        ranges = list(zip(bounds[:-1], bounds[1:]))[::-1]
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            frames = list(ex.map(lambda r: self.extract_invoices(date_range=r), ranges))
+        
+        # Empty ranges carry untyped columns; leave them out of the concat
+        non_empty = [df for df in frames if len(df)] or frames[:1]
+        return pd.concat(non_empty, ignore_index=True)
+    
+    @_memoize()
+    def extract_clients(self, conn: Optional[pyodbc.Connection] = None,
+                        iter_chunks: bool = False) -> pd.DataFrame:
         """
         Extracts client master data with credit terms and limits.
         
+        Args:
+            conn: Open connection to reuse (a new one is opened if None)
+            iter_chunks: Return a generator of DataFrame chunks instead of one frame
+            
         Returns:
             DataFrame with ClientID, ClientName, PaymentTerms, CreditLimit
         """
@@ -118,19 +499,24 @@ class ParsonsDataEngine:
             ClientID,
             ClientName,
             PaymentTerms,
-            CreditLimit,
+            CAST(CreditLimit AS FLOAT) as CreditLimit,
             Industry,
             ContactEmail
         FROM Clients
         ORDER BY ClientName
         """
-        with self.get_connection() as conn:
-            return pd.read_sql(query, conn)
+        return self._read(query, dtype={'ClientID': _KEY}, conn=conn, iter_chunks=iter_chunks)
     
-    def extract_projects(self) -> pd.DataFrame:
+    @_memoize()
+    def extract_projects(self, conn: Optional[pyodbc.Connection] = None,
+                         iter_chunks: bool = False) -> pd.DataFrame:
         """
         Extracts project details with sector and region breakdown.
         
+        Args:
+            conn: Open connection to reuse (a new one is opened if None)
+            iter_chunks: Return a generator of DataFrame chunks instead of one frame
+            
         Returns:
             DataFrame with ProjectID, ProjectName, Sector, Region, StartDate, Budget
         """
@@ -143,18 +529,25 @@ class ParsonsDataEngine:
             ClientID,
             StartDate,
             EndDate,
-            Budget,
+            CAST(Budget AS FLOAT) as Budget,
             Status as ProjectStatus
         FROM Projects
         ORDER BY ProjectName
         """
-        with self.get_connection() as conn:
-            return pd.read_sql(query, conn)
+        return self._read(query, parse_dates=['StartDate', 'EndDate'],
+                          dtype={'ProjectID': _KEY, 'ClientID': _KEY},
+                          conn=conn, iter_chunks=iter_chunks)
     
-    def extract_unbilled_work(self) -> pd.DataFrame:
+    @_memoize()
+    def extract_unbilled_work(self, conn: Optional[pyodbc.Connection] = None,
+                              iter_chunks: bool = False) -> pd.DataFrame:
         """
         Extracts work-in-progress data for WIP leakage analysis.
         
+        Args:
+            conn: Open connection to reuse (a new one is opened if None)
+            iter_chunks: Return a generator of DataFrame chunks instead of one frame
+            
         Returns:
             DataFrame with WorkID, ProjectID, ProjectName, EstimatedValue, LogDate
         """
@@ -165,7 +558,7 @@ class ParsonsDataEngine:
             p.ProjectName,
             p.Sector,
             p.Region,
-            u.EstimatedValue,
+            CAST(u.EstimatedValue AS FLOAT) as EstimatedValue,
             u.LogDate,
             u.Description,
             DATEDIFF(day, u.LogDate, GETDATE()) as DaysSinceLogged
@@ -173,24 +566,36 @@ class ParsonsDataEngine:
         JOIN Projects p ON u.ProjectID = p.ProjectID
         ORDER BY u.LogDate DESC
         """
-        with self.get_connection() as conn:
-            return pd.read_sql(query, conn)
+        return self._read(
+            query,
+            parse_dates=['LogDate'],
+            dtype={'WorkID': _KEY, 'ProjectID': _KEY,
+                   'EstimatedValue': 'float64', 'DaysSinceLogged': 'int32'},
+            conn=conn, iter_chunks=iter_chunks
+        )
     
     def extract_ar_report(self) -> pd.DataFrame:
         """
         Extracts the full Accounts Receivable and Aging status.
-        Legacy method for backwards compatibility.
+        Legacy method for backwards compatibility; shares the memoized
+        extract_invoices result.
         
         Returns:
             DataFrame with AR data including DaysOverdue
         """
         return self.extract_invoices()
     
-    def extract_wip_leakage(self) -> pd.DataFrame:
+    @_memoize()
+    def extract_wip_leakage(self, conn: Optional[pyodbc.Connection] = None,
+                            iter_chunks: bool = False) -> pd.DataFrame:
         """
         Extracts aggregated WIP by project for leakage analysis.
         Legacy method for backwards compatibility.
         
+        Args:
+            conn: Open connection to reuse (a new one is opened if None)
+            iter_chunks: Return a generator of DataFrame chunks instead of one frame
+            
         Returns:
             DataFrame with ProjectName and UnbilledValue
         """
@@ -199,7 +604,7 @@ class ParsonsDataEngine:
             p.ProjectID,
             p.ProjectName, 
             p.Sector,
-            SUM(u.EstimatedValue) as UnbilledValue,
+            CAST(SUM(u.EstimatedValue) AS FLOAT) as UnbilledValue,
             COUNT(u.WorkID) as UnbilledItems,
             MIN(u.LogDate) as OldestEntry,
             MAX(u.LogDate) as NewestEntry
@@ -209,8 +614,69 @@ class ParsonsDataEngine:
         HAVING SUM(u.EstimatedValue) > 0
         ORDER BY UnbilledValue DESC
         """
-        with self.get_connection() as conn:
-            return pd.read_sql(query, conn)
+        return self._read(query, parse_dates=['OldestEntry', 'NewestEntry'],
+                          dtype={'ProjectID': _KEY, 'UnbilledItems': 'int32'},
+                          conn=conn, iter_chunks=iter_chunks)
+    
+    def _watermark(self, name: str, conn: pyodbc.Connection) -> str:
+        """
+        Probe the source tables of an extract for a cheap change marker.
+        
+        Args:
+            name: Extract name (key of extract_all)
+            conn: Open database connection
+            
+        Returns:
+            String built from row counts and latest change timestamps
+        """
+        probes = [f"(SELECT CONCAT(COUNT(*), '@', MAX({col})) FROM {table})"
+                  for table, col in _WATERMARK_SOURCES[name]]
+        if name in _DAILY_EXTRACTS:
+            probes.append("CONVERT(varchar(10), GETDATE(), 23)")
+        
+        cursor = self._make_cursor(conn)
+        try:
+            cursor.execute("SELECT " + ", ".join(probes))
+            return '|'.join(str(value) for value in cursor.fetchone())
+        finally:
+            cursor.close()
+    
+    def _cache_read(self, name: str, extract: Callable, conn: pyodbc.Connection) -> pd.DataFrame:
+        """
+        Return an extract from the local Parquet cache if its watermark still matches.
+        
+        On a miss the extract is fetched and written back with its watermark.
+        Cache I/O problems fall back to a plain fetch.
+        
+        Args:
+            name: Extract name (key of extract_all)
+            extract: Bound extract_* method
+            conn: Open database connection
+            
+        Returns:
+            Extracted DataFrame
+        """
+        path = os.path.join(config.EXTRACT_CACHE_DIR, f'{name}.parquet')
+        mark_path = path + '.watermark'
+        mark = self._watermark(name, conn)
+        
+        try:
+            with open(mark_path) as f:
+                if f.read() == mark:
+                    return pd.read_parquet(path)
+        except (ImportError, OSError, ValueError):
+            pass
+        
+        df = extract(conn=conn)
+        try:
+            os.makedirs(config.EXTRACT_CACHE_DIR, exist_ok=True)
+            df.to_parquet(path + '.tmp', compression='zstd')
+            os.replace(path + '.tmp', path)
+            with open(mark_path, 'w') as f:
+                f.write(mark)
+        except (ImportError, OSError, ValueError):
+            pass
+        return df
     
     def extract_all(self) -> Dict[str, pd.DataFrame]:
         """
@@ -219,18 +685,39 @@ class ParsonsDataEngine:
         Returns:
             Dictionary with keys: 'invoices', 'clients', 'projects', 'unbilled_work', 'wip_summary'
         """
-        print(f"[{datetime.now()}] Starting live extraction from {self.database}...")
+        log.info("Starting live extraction from %s...", self.database)
         
-        data = {
-            'invoices': self.extract_invoices(),
-            'clients': self.extract_clients(),
-            'projects': self.extract_projects(),
-            'unbilled_work': self.extract_unbilled_work(),
-            'wip_summary': self.extract_wip_leakage()
+        extracts = {
+            'invoices': self.extract_invoices,
+            'clients': self.extract_clients,
+            'projects': self.extract_projects,
+            'unbilled_work': self.extract_unbilled_work,
+            'wip_summary': self.extract_wip_leakage
         }
+        pool = self.connection_pool()
+        
+        def fetch(key, extract, conn):
+            if config.EXTRACT_CACHE_ENABLED:
+                return self._cache_read(key, extract, conn)
+            return extract(conn=conn)
+        
+        if self.parallel:
+            # pyodbc connections are not shared across threads; each query
+            # borrows its own from the pool
+            def run(key, extract):
+                with pool.connection() as conn:
+                    return fetch(key, extract, conn)
+            
+            with ThreadPoolExecutor(max_workers=len(extracts)) as ex:
+                futures = {key: ex.submit(run, key, fn) for key, fn in extracts.items()}
+                data = {key: fut.result() for key, fut in futures.items()}
+        else:
+            # One pooled connection serves the whole batch
+            with pool.connection() as conn:
+                data = {key: fetch(key, fn, conn) for key, fn in extracts.items()}
         
         total_records = sum(len(df) for df in data.values())
-        print(f"[{datetime.now()}] Extraction complete. Total records: {total_records:,}")
+        log.info("Extraction complete. Total records: %d", total_records)
         
         return data
     
@@ -250,21 +737,22 @@ class ParsonsDataEngine:
             'total_overdue': "SELECT SUM(InvoiceAmount) FROM Invoices WHERE Status = 'Overdue'"
         }
         
-        stats = {}
+        # All metrics as scalar subqueries of one statement: a single round trip
+        batch = "SELECT " + ",\n       ".join(f"({query})" for query in queries.values())
+        
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            for key, query in queries.items():
-                cursor.execute(query)
-                result = cursor.fetchone()[0]
-                stats[key] = result if result else 0
-                
-        return stats
+            cursor = self._make_cursor(conn)
+            cursor.execute(batch)
+            row = cursor.fetchone()
+            
+        return {key: result if result else 0 for key, result in zip(queries, row)}
 
 
 # =============================================================================
 # STANDALONE EXECUTION
 # =============================================================================
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
     engine = ParsonsDataEngine()
     
     print("=" * 60)
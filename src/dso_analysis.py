@@ -15,6 +15,41 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+# Arrow compute kernels for status matching on Arrow-backed string columns
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+_OPEN_STATUSES = ('pending', 'overdue', 'outstanding')
+
+# Inner aging edges (30, 60, 90) and the categorical dtype used for bucket labels
+_AGING_EDGES = np.asarray(config.AGING_BUCKETS[1:-1], dtype=float)
+_AGING_DTYPE = pd.CategoricalDtype(config.BUCKET_LABELS, ordered=True)
+
+# Health rating ladder: a rating is reached once the 90+ share exceeds the
+# toxic edge or the 61-90 share exceeds the warning edge for that level
+_HEALTH_LABELS = np.array(['Excellent', 'Good', 'Fair', 'Poor', 'Critical'], dtype=object)
+_TOXIC_EDGES = np.array([0, 5, 15, 25], dtype=float)
+_WARNING_EDGES = np.array([5, 15, 25], dtype=float)
+
+
+def score_health(toxic_pct, warning_pct) -> np.ndarray:
+    """
+    Rate AR health from aging percentages, for one or many periods at once.
+    
+    Args:
+        toxic_pct: Percentage of AR in the 90+ bucket (scalar or array)
+        warning_pct: Percentage of AR in the 61-90 bucket (scalar or array)
+        
+    Returns:
+        Array of ratings: Excellent, Good, Fair, Poor, Critical
+    """
+    toxic_idx = np.searchsorted(_TOXIC_EDGES, np.atleast_1d(toxic_pct), side='left')
+    warning_idx = np.searchsorted(_WARNING_EDGES, np.atleast_1d(warning_pct), side='left')
+    return _HEALTH_LABELS[np.maximum(toxic_idx, warning_idx)]
+
 
 class DSOAnalyzer:
     """
@@ -36,8 +71,15 @@ class DSOAnalyzer:
         Args:
             invoices_df: Cleaned invoices DataFrame
         """
-        self.df = invoices_df.copy()
+        # Shallow copy: derived columns added here never reach the caller's
+        # frame, and the invoice data itself is not duplicated
+        self.df = invoices_df.copy(deep=False)
         self._validate_data()
+        self._build_status_masks()
+        self._days = self._extract_days_overdue()
+        
+        if 'MonthYear' not in self.df.columns and 'InvoiceDate' in self.df.columns:
+            self.df['MonthYear'] = pd.to_datetime(self.df['InvoiceDate']).dt.to_period('M')
     
     def _validate_data(self):
         """Ensure required columns exist."""
@@ -46,6 +88,68 @@ class DSOAnalyzer:
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
     
+    def _extract_days_overdue(self) -> Optional[np.ndarray]:
+        """
+        Days overdue as a contiguous array, derived from DueDate if needed.
+        
+        Complete integer data is held as int32; gaps are kept as NaN in a
+        float array so they can still be told apart.
+        
+        Returns:
+            Array of days overdue, or None if neither column is available
+        """
+        if 'DaysOverdue' in self.df.columns:
+            days = self.df['DaysOverdue']
+            if pd.api.types.is_integer_dtype(days) and not days.hasnans:
+                return days.to_numpy(dtype=np.int32)
+            return days.to_numpy(dtype=float)
+        
+        if 'DueDate' in self.df.columns:
+            due = pd.to_datetime(self.df['DueDate']).to_numpy(dtype='datetime64[D]')
+            elapsed = np.datetime64('today', 'D') - due
+            missing = np.isnat(elapsed)
+            if missing.any():
+                return np.where(missing, np.nan, elapsed.astype(np.int64))
+            return elapsed.astype(np.int32)
+        
+        return None
+    
+    def _build_status_masks(self):
+        """
+        Cache boolean masks for unpaid and overdue invoices.
+        
+        Status is lower-cased once per category rather than once per row and
+        per method call; Arrow-backed string columns are matched with Arrow
+        compute kernels on their buffers instead. The IsOpen flag computed in
+        SQL is used when present.
+        """
+        status = self.df['Status']
+        if pc is not None and self._is_arrow_backed(status):
+            lowered = pc.utf8_lower(pa.array(status.array))
+            open_mask = pc.is_in(lowered, value_set=pa.array(_OPEN_STATUSES))
+            overdue_mask = pc.fill_null(pc.equal(lowered, 'overdue'), False)
+            self._overdue_mask = overdue_mask.to_numpy(zero_copy_only=False)
+        else:
+            if not isinstance(status.dtype, pd.CategoricalDtype):
+                status = status.astype('category')
+            codes = status.cat.codes.to_numpy()
+            categories = status.cat.categories.astype(str).str.lower()
+            open_mask = np.isin(codes, np.flatnonzero(categories.isin(_OPEN_STATUSES)))
+            self._overdue_mask = np.isin(codes, np.flatnonzero(categories == 'overdue'))
+        
+        if 'IsOpen' in self.df.columns:
+            self._open_mask = self.df['IsOpen'].to_numpy(dtype=bool)
+        elif isinstance(open_mask, np.ndarray):
+            self._open_mask = open_mask
+        else:
+            self._open_mask = open_mask.to_numpy(zero_copy_only=False)
+    
+    @staticmethod
+    def _is_arrow_backed(col: pd.Series) -> bool:
+        """Whether a column's values live in Arrow buffers."""
+        return (isinstance(col.dtype, pd.ArrowDtype)
+                or getattr(col.dtype, 'storage', None) == 'pyarrow')
+    
     def calculate_dso(self, period_days: int = 30) -> float:
         """
         Calculate Days Sales Outstanding.
@@ -59,7 +163,7 @@ class DSOAnalyzer:
             DSO value in days
         """
         # AR = Outstanding + Overdue invoices (not paid)
-        ar_df = self.df[self.df['Status'].str.lower().isin(['pending', 'overdue', 'outstanding'])]
+        ar_df = self.df[self._open_mask]
         average_ar = ar_df['InvoiceAmount'].mean() if len(ar_df) > 0 else 0
         
         # Total credit sales = All invoices
@@ -79,35 +183,26 @@ class DSOAnalyzer:
             periods: Number of periods to analyze
             
         Returns:
-            DataFrame with Period and DSO columns
+            DataFrame with Period and DSO columns for the latest periods, oldest first
         """
-        if 'MonthYear' not in self.df.columns and 'InvoiceDate' in self.df.columns:
-            self.df['MonthYear'] = pd.to_datetime(self.df['InvoiceDate']).dt.to_period('M')
-        
-        trend_data = []
-        
-        for period in self.df['MonthYear'].dropna().unique()[-periods:]:
-            period_df = self.df[self.df['MonthYear'] == period]
-            
-            ar_value = period_df[
-                period_df['Status'].str.lower().isin(['pending', 'overdue', 'outstanding'])
-            ]['InvoiceAmount'].sum()
-            
-            total_sales = period_df['InvoiceAmount'].sum()
-            
-            if total_sales > 0:
-                dso = (ar_value / total_sales) * 30  # Monthly DSO
-            else:
-                dso = 0
-            
-            trend_data.append({
-                'Period': str(period),
-                'DSO': round(dso, 2),
-                'AR_Value': ar_value,
-                'Total_Sales': total_sales
-            })
-        
-        return pd.DataFrame(trend_data)
+        amounts = self.df['InvoiceAmount']
+        monthly = pd.DataFrame({
+            'MonthYear': self.df['MonthYear'],
+            'AR_Value': amounts.where(self._open_mask, 0.0),
+            'Total_Sales': amounts
+        }).groupby('MonthYear', sort=True).sum().tail(periods)
+        
+        ar_value = monthly['AR_Value'].to_numpy()
+        total_sales = monthly['Total_Sales'].to_numpy()
+        has_sales = total_sales > 0
+        dso = np.where(has_sales, ar_value / np.where(has_sales, total_sales, 1) * 30, 0.0)  # Monthly DSO
+        
+        return pd.DataFrame({
+            'Period': monthly.index.astype(str),
+            'DSO': dso.round(2),
+            'AR_Value': ar_value,
+            'Total_Sales': total_sales
+        })
     
     def calculate_aging_buckets(self) -> pd.DataFrame:
         """
@@ -116,26 +211,35 @@ class DSOAnalyzer:
         Returns:
             DataFrame with AgingBucket column added
         """
-        df = self.df.copy()
-        
-        if 'DaysOverdue' not in df.columns:
-            if 'DueDate' in df.columns:
-                df['DaysOverdue'] = (datetime.now() - pd.to_datetime(df['DueDate'])).dt.days
-            else:
-                raise ValueError("DaysOverdue or DueDate column required")
-        
-        # Assign buckets
-        conditions = [
-            df['DaysOverdue'] <= 30,
-            (df['DaysOverdue'] > 30) & (df['DaysOverdue'] <= 60),
-            (df['DaysOverdue'] > 60) & (df['DaysOverdue'] <= 90),
-            df['DaysOverdue'] > 90
-        ]
-        
-        choices = config.BUCKET_LABELS
-        df['AgingBucket'] = np.select(conditions, choices, default=choices[0])
-        
-        return df
+        if self._days is None:
+            raise ValueError("DaysOverdue or DueDate column required")
+        
+        new_columns = {}
+        if 'DaysOverdue' not in self.df.columns:
+            new_columns['DaysOverdue'] = self._days
+        
+        codes = self._aging_codes(self._days)
+        new_columns['AgingBucket'] = pd.Categorical.from_codes(codes, dtype=_AGING_DTYPE)
+        
+        return self.df.assign(**new_columns)
+    
+    @staticmethod
+    def _aging_codes(days: np.ndarray) -> np.ndarray:
+        """
+        Map days overdue to aging bucket codes in one pass.
+        
+        (-inf, 30] -> 0, (30, 60] -> 1, ...; missing values fall into the
+        current bucket.
+        
+        Args:
+            days: Days overdue per invoice
+            
+        Returns:
+            Integer code array indexing config.BUCKET_LABELS
+        """
+        codes = np.digitize(days, _AGING_EDGES, right=True)
+        codes[np.isnan(days)] = 0
+        return codes
     
     def get_aging_summary(self) -> pd.DataFrame:
         """
@@ -144,26 +248,27 @@ class DSOAnalyzer:
         Returns:
             DataFrame with Bucket, Count, Amount, Percentage columns
         """
-        df = self.calculate_aging_buckets()
-        
-        # Only include unpaid invoices
-        unpaid = df[df['Status'].str.lower().isin(['pending', 'overdue', 'outstanding'])]
-        
-        summary = unpaid.groupby('AgingBucket', observed=True).agg({
-            'InvoiceID': 'count',
-            'InvoiceAmount': 'sum'
-        }).reset_index()
-        
-        summary.columns = ['AgingBucket', 'Count', 'Amount']
-        
-        total_amount = summary['Amount'].sum()
-        summary['Percentage'] = (summary['Amount'] / total_amount * 100).round(2)
-        
-        # Ensure all buckets are represented
-        all_buckets = pd.DataFrame({'AgingBucket': config.BUCKET_LABELS})
-        summary = all_buckets.merge(summary, on='AgingBucket', how='left').fillna(0)
-        
-        return summary
+        if self._days is None:
+            raise ValueError("DaysOverdue or DueDate column required")
+        
+        # Only include unpaid invoices; tally straight from the bucket codes
+        # instead of building a bucketed frame and grouping it
+        codes = self._aging_codes(self._days[self._open_mask])
+        amounts = self.df['InvoiceAmount'].to_numpy(dtype=float, na_value=0.0)[self._open_mask]
+        n_buckets = len(config.BUCKET_LABELS)
+        
+        counts = np.bincount(codes, minlength=n_buckets)
+        sums = np.bincount(codes, weights=amounts, minlength=n_buckets)
+        
+        total_amount = sums.sum()
+        percentage = (sums / total_amount * 100).round(2) if total_amount else np.zeros(n_buckets)
+        
+        return pd.DataFrame({
+            'AgingBucket': pd.Categorical.from_codes(np.arange(n_buckets), dtype=_AGING_DTYPE),
+            'Count': counts,
+            'Amount': sums,
+            'Percentage': percentage
+        })
     
     def identify_toxic_debt(self, days_threshold: int = 90) -> pd.DataFrame:
         """
@@ -175,16 +280,11 @@ class DSOAnalyzer:
         Returns:
             DataFrame with toxic debt invoices
         """
-        df = self.df.copy()
-        
-        if 'DaysOverdue' not in df.columns:
+        if 'DaysOverdue' not in self.df.columns:
             raise ValueError("DaysOverdue column required")
         
-        toxic = df[
-            (df['DaysOverdue'] > days_threshold) & 
-            (df['Status'].str.lower().isin(['pending', 'overdue', 'outstanding']))
-        ].copy()
-        
+        # Boolean selection already yields an independent frame
+        toxic = self.df[(self._days > days_threshold) & self._open_mask]
         toxic = toxic.sort_values('DaysOverdue', ascending=False)
         
         return toxic
@@ -201,12 +301,8 @@ class DSOAnalyzer:
         
         report = {
             'dso': self.calculate_dso(),
-            'total_ar': self.df[
-                self.df['Status'].str.lower().isin(['pending', 'overdue', 'outstanding'])
-            ]['InvoiceAmount'].sum(),
-            'total_overdue': self.df[
-                self.df['Status'].str.lower() == 'overdue'
-            ]['InvoiceAmount'].sum(),
+            'total_ar': self.df.loc[self._open_mask, 'InvoiceAmount'].sum(),
+            'total_overdue': self.df.loc[self._overdue_mask, 'InvoiceAmount'].sum(),
             'toxic_debt_amount': toxic_debt['InvoiceAmount'].sum() if len(toxic_debt) > 0 else 0,
             'toxic_debt_count': len(toxic_debt),
             'aging_breakdown': aging_summary.to_dict('records'),
@@ -239,16 +335,7 @@ class DSOAnalyzer:
             aging_summary['AgingBucket'] == config.BUCKET_LABELS[2]
         ]['Percentage'].sum()
         
-        if toxic_pct > 25:
-            return 'Critical'
-        elif toxic_pct > 15 or warning_pct > 25:
-            return 'Poor'
-        elif toxic_pct > 5 or warning_pct > 15:
-            return 'Fair'
-        elif toxic_pct > 0 or warning_pct > 5:
-            return 'Good'
-        else:
-            return 'Excellent'
+        return score_health(toxic_pct, warning_pct)[0]
 
 
 # =============================================================================
@@ -9,13 +9,50 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from scipy import stats
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+# Period ordinal pandas uses for NaT
+_NAT_ORDINAL = np.iinfo(np.int64).min
+
+# Risk level bins over RiskProbability: (0, 0.25] Low ... (0.75, 1] Critical
+_RISK_LEVEL_EDGES = np.array([0, 0.25, 0.5, 0.75, 1.0])
+_RISK_LEVEL_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Critical'], ordered=True)
+
+# Forecast row labels; categorical so consumers split on int8 codes
+_FORECAST_TYPE_DTYPE = pd.CategoricalDtype(list(config.FORECAST_TYPES))
+
+
+def _fit_line(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Ordinary least-squares line through (x, y) in closed form.
+    
+    Args:
+        x: Independent values
+        y: Dependent values
+        
+    Returns:
+        Tuple of (slope, intercept, r_squared); r_squared is 0 for a flat y
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    
+    sxy = dx @ dy
+    sxx = dx @ dx
+    syy = dy @ dy
+    
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+    r_squared = sxy * sxy / (sxx * syy) if syy else 0.0
+    return slope, intercept, r_squared
+
 
 class PredictiveAnalyzer:
     """
@@ -35,20 +72,80 @@ class PredictiveAnalyzer:
         Args:
             invoices_df: Cleaned invoices DataFrame with date columns
         """
-        self.df = invoices_df.copy()
+        # Only derived columns are ever written, so a shallow copy keeps them
+        # off the caller's frame without duplicating the invoice data
+        self.df = invoices_df.copy(deep=False)
+        self._period_totals_cache = {}
         self._prepare_time_series_data()
     
+    def refresh(self):
+        """Drop cached per-period aggregates, e.g. after editing self.df."""
+        self._period_totals_cache.clear()
+    
+    def _period_totals(self, period_col: str, column: str = 'InvoiceAmount',
+                       how: str = 'sum') -> pd.Series:
+        """
+        Per-period aggregate of one column, grouped once and cached.
+        
+        Args:
+            period_col: Period column to group by ('YearMonth' or 'Quarter')
+            column: Column to aggregate
+            how: Aggregation name ('sum', 'count', ...)
+            
+        Returns:
+            Series indexed by period in time order
+        """
+        key = (period_col, column, how)
+        if key not in self._period_totals_cache:
+            # Hash-order groups, then sort the few period rows explicitly
+            totals = self.df.groupby(period_col, sort=False)[column].agg(how)
+            self._period_totals_cache[key] = totals.sort_index()
+        return self._period_totals_cache[key]
+    
     def _prepare_time_series_data(self):
-        """Prepare data for time series analysis."""
-        if 'InvoiceDate' in self.df.columns:
+        """
+        Prepare data for time series analysis.
+        
+        Period columns already present (YearMonth, or DataCleaner's MonthYear,
+        Quarter and Year) are reused; otherwise they are built from one
+        month-ordinal pass over InvoiceDate. Period keys are int64 ordinals
+        underneath and ClientName is made categorical, so the groupbys below
+        hash integers rather than strings.
+        """
+        if 'ClientName' in self.df.columns and not isinstance(self.df['ClientName'].dtype, pd.CategoricalDtype):
+            self.df['ClientName'] = self.df['ClientName'].astype('category')
+        
+        if 'InvoiceDate' not in self.df.columns:
+            return
+        
+        if not pd.api.types.is_datetime64_any_dtype(self.df['InvoiceDate']):
             self.df['InvoiceDate'] = pd.to_datetime(self.df['InvoiceDate'])
-            self.df['YearMonth'] = self.df['InvoiceDate'].dt.to_period('M')
-            self.df['Quarter'] = self.df['InvoiceDate'].dt.to_period('Q')
+        
+        month_dtype = pd.PeriodDtype('M')
+        quarter_dtype = pd.PeriodDtype('Q')
+        month_col = next((col for col in ('YearMonth', 'MonthYear')
+                          if col in self.df.columns and self.df[col].dtype == month_dtype), None)
+        have_month = month_col is not None
+        have_quarter = 'Quarter' in self.df.columns and self.df['Quarter'].dtype == quarter_dtype
+        
+        if not (have_month and have_quarter):
+            dates = self.df['InvoiceDate'].to_numpy(dtype='datetime64[ns]')
+            nat = np.isnat(dates)
+            months = np.where(nat, _NAT_ORDINAL, dates.astype('datetime64[M]').astype(np.int64))
+            quarters = np.where(nat, _NAT_ORDINAL, months // 12 * 4 + months % 12 // 3)
+        
+        if month_col != 'YearMonth':
+            self.df['YearMonth'] = (self.df[month_col] if have_month
+                                    else pd.arrays.PeriodArray(months, dtype=month_dtype))
+        if not have_quarter:
+            self.df['Quarter'] = pd.arrays.PeriodArray(quarters, dtype=quarter_dtype)
+        if 'Year' not in self.df.columns:
             self.df['Year'] = self.df['InvoiceDate'].dt.year
     
     def calculate_moving_average(self, column: str = 'InvoiceAmount', 
                                   window: int = None,
-                                  period: str = 'M') -> pd.DataFrame:
+                                  period: str = 'M',
+                                  include_counts: bool = False) -> pd.DataFrame:
         """
         Calculate moving average for a given column over time.
         
@@ -56,9 +153,10 @@ class PredictiveAnalyzer:
             column: Column to calculate MA for
             window: Window size for MA (default from config)
             period: Time period - 'M' for monthly, 'Q' for quarterly
+            include_counts: Add a Count column of invoices per period
             
         Returns:
-            DataFrame with Period, Value, and MovingAverage columns
+            DataFrame with Period, Value, (Count,) MovingAverage and Trend columns
         """
         window = window or config.MOVING_AVERAGE_WINDOW
         
@@ -71,21 +169,22 @@ class PredictiveAnalyzer:
         if period_col not in self.df.columns:
             raise ValueError(f"Period column {period_col} not found")
         
-        time_series = self.df.groupby(period_col, as_index=False).agg({
-            column: 'sum',
-            'InvoiceID': 'count'
-        })
-        time_series.columns = ['Period', 'Value', 'Count']
+        totals = self._period_totals(period_col, column)
+        time_series = pd.DataFrame({'Period': totals.index, 'Value': totals.to_numpy()})
+        if include_counts:
+            time_series['Count'] = self._period_totals(period_col, 'InvoiceID', 'count').to_numpy()
         
-        # Calculate moving average
-        time_series['MovingAverage'] = time_series['Value'].rolling(
-            window=window, min_periods=1
-        ).mean()
+        # Calculate moving average from a running sum: O(n) for any window,
+        # averaging over fewer periods at the start like min_periods=1
+        values = time_series['Value'].to_numpy(dtype=float)
+        running = np.concatenate(([0.0], np.cumsum(values)))
+        ends = np.arange(1, len(values) + 1)
+        starts = np.maximum(ends - window, 0)
+        time_series['MovingAverage'] = (running[ends] - running[starts]) / (ends - starts)
         
         # Calculate trend direction
-        time_series['Trend'] = time_series['MovingAverage'].diff().apply(
-            lambda x: 'Up' if x > 0 else ('Down' if x < 0 else 'Flat')
-        )
+        change = time_series['MovingAverage'].diff().to_numpy()
+        time_series['Trend'] = np.select([change > 0, change < 0], ['Up', 'Down'], default='Flat')
         
         time_series['Period'] = time_series['Period'].astype(str)
         
@@ -104,12 +203,13 @@ class PredictiveAnalyzer:
         periods_ahead = periods_ahead or config.FORECAST_PERIODS
         
         # Aggregate by quarter
-        quarterly = self.df.groupby('Quarter', as_index=False).agg({
-            'InvoiceAmount': 'sum'
+        totals = self._period_totals('Quarter')
+        # Period keys come back from the groupby already in time order; they
+        # only become string labels in the output
+        quarterly = pd.DataFrame({
+            'Quarter': totals.index.array,
+            'CashInflow': totals.to_numpy()
         })
-        quarterly.columns = ['Quarter', 'CashInflow']
-        quarterly['Quarter'] = quarterly['Quarter'].astype(str)
-        quarterly = quarterly.sort_values('Quarter')
         
         # Create numeric index for regression
         quarterly['PeriodIndex'] = range(len(quarterly))
@@ -121,45 +221,42 @@ class PredictiveAnalyzer:
         X = quarterly['PeriodIndex'].values
         y = quarterly['CashInflow'].values
         
-        slope, intercept, r_value, p_value, std_err = stats.linregress(X, y)
+        slope, intercept, r_squared = _fit_line(X, y)
         
         # Calculate historical standard deviation for realistic CI
         y_std = np.std(y)
         y_mean = np.mean(y)
         
-        # Generate forecasts
-        last_index = quarterly['PeriodIndex'].max()
-        forecast_indices = range(int(last_index) + 1, int(last_index) + periods_ahead + 1)
+        # Generate all forecast periods at once
+        last_index = int(X.max())
+        steps = np.arange(1, periods_ahead + 1)
+        predicted = intercept + slope * (last_index + steps)
+        
+        # Use a reasonable confidence interval based on historical variance
+        # CI widens slightly for each period ahead
+        ci_width = y_std * (1 + 0.1 * (steps - 1)) * config.CONFIDENCE_INTERVAL
+        
+        forecasts = pd.DataFrame({
+            'Period': [f'Q{step} Ahead' for step in steps],
+            'Forecast': np.clip(predicted, 0, None),
+            'CI_Lower': np.clip(predicted - ci_width, 0, None),
+            'CI_Upper': np.clip(predicted + ci_width, 0, None),
+            'Type': pd.Categorical.from_codes(np.ones(len(steps), dtype=np.int8), dtype=_FORECAST_TYPE_DTYPE),
+            'R_Squared': r_squared
+        })
         
-        forecasts = []
-        for i, idx in enumerate(forecast_indices):
-            predicted = intercept + slope * idx
-            
-            # Use a reasonable confidence interval based on historical variance
-            # CI widens slightly for each period ahead
-            ci_width = y_std * (1 + 0.1 * i) * config.CONFIDENCE_INTERVAL
-            ci_lower = predicted - ci_width
-            ci_upper = predicted + ci_width
-            
-            forecasts.append({
-                'Period': f'Q{idx - last_index} Ahead',
-                'Forecast': max(0, predicted),
-                'CI_Lower': max(0, ci_lower),
-                'CI_Upper': max(0, ci_upper),
-                'Type': 'Forecast'
-            })
-        
-        # Combine historical and forecast
-        historical = quarterly[['Quarter', 'CashInflow']].copy()
-        historical.columns = ['Period', 'Forecast']
-        historical['CI_Lower'] = historical['Forecast']
-        historical['CI_Upper'] = historical['Forecast']
-        historical['Type'] = 'Historical'
-        
-        forecast_df = pd.concat([historical, pd.DataFrame(forecasts)], ignore_index=True)
-        forecast_df['R_Squared'] = r_value ** 2
-        
-        return forecast_df
+        # Combine historical and forecast; both parts are built with their
+        # final columns so the concat is the only copy
+        historical = pd.DataFrame({
+            'Period': quarterly['Quarter'].astype(str).to_numpy(),
+            'Forecast': y,
+            'CI_Lower': y,
+            'CI_Upper': y,
+            'Type': pd.Categorical.from_codes(np.zeros(len(y), dtype=np.int8), dtype=_FORECAST_TYPE_DTYPE),
+            'R_Squared': r_squared
+        })
+        
+        return pd.concat([historical, forecasts], ignore_index=True)
     
     def forecast_monthly_inflow(self, periods_ahead: int = 6) -> pd.DataFrame:
         """
@@ -172,12 +269,13 @@ class PredictiveAnalyzer:
             DataFrame with forecasted values and confidence intervals
         """
         # Aggregate by month
-        monthly = self.df.groupby('YearMonth', as_index=False).agg({
-            'InvoiceAmount': 'sum'
+        totals = self._period_totals('YearMonth')
+        # Period keys come back from the groupby already in time order; they
+        # only become string labels in the output
+        monthly = pd.DataFrame({
+            'YearMonth': totals.index.array,
+            'CashInflow': totals.to_numpy()
         })
-        monthly.columns = ['YearMonth', 'CashInflow']
-        monthly['YearMonth'] = monthly['YearMonth'].astype(str)
-        monthly = monthly.sort_values('YearMonth')
         
         # Create numeric index for regression
         monthly['PeriodIndex'] = range(len(monthly))
@@ -189,44 +287,41 @@ class PredictiveAnalyzer:
         X = monthly['PeriodIndex'].values
         y = monthly['CashInflow'].values
         
-        slope, intercept, r_value, p_value, std_err = stats.linregress(X, y)
+        slope, intercept, r_squared = _fit_line(X, y)
         
         # Calculate historical standard deviation for realistic CI
         y_std = np.std(y)
         
-        # Generate forecasts
-        last_index = monthly['PeriodIndex'].max()
-        forecast_indices = range(int(last_index) + 1, int(last_index) + periods_ahead + 1)
+        # Generate all forecast periods at once
+        last_index = int(X.max())
+        steps = np.arange(1, periods_ahead + 1)
+        predicted = intercept + slope * (last_index + steps)
+        
+        # Use a reasonable confidence interval based on historical variance
+        # CI widens slightly for each period ahead
+        ci_width = y_std * (1 + 0.05 * (steps - 1)) * config.CONFIDENCE_INTERVAL
+        
+        forecasts = pd.DataFrame({
+            'Period': [f'M+{step}' for step in steps],
+            'Forecast': np.clip(predicted, 0, None),
+            'CI_Lower': np.clip(predicted - ci_width, 0, None),
+            'CI_Upper': np.clip(predicted + ci_width, 0, None),
+            'Type': pd.Categorical.from_codes(np.ones(len(steps), dtype=np.int8), dtype=_FORECAST_TYPE_DTYPE),
+            'R_Squared': r_squared
+        })
         
-        forecasts = []
-        for i, idx in enumerate(forecast_indices):
-            predicted = intercept + slope * idx
-            
-            # Use a reasonable confidence interval based on historical variance
-            # CI widens slightly for each period ahead
-            ci_width = y_std * (1 + 0.05 * i) * config.CONFIDENCE_INTERVAL
-            ci_lower = predicted - ci_width
-            ci_upper = predicted + ci_width
-            
-            forecasts.append({
-                'Period': f'M+{idx - last_index}',
-                'Forecast': max(0, predicted),
-                'CI_Lower': max(0, ci_lower),
-                'CI_Upper': max(0, ci_upper),
-                'Type': 'Forecast'
-            })
-        
-        # Combine historical and forecast
-        historical = monthly[['YearMonth', 'CashInflow']].copy()
-        historical.columns = ['Period', 'Forecast']
-        historical['CI_Lower'] = historical['Forecast']
-        historical['CI_Upper'] = historical['Forecast']
-        historical['Type'] = 'Historical'
-        
-        forecast_df = pd.concat([historical, pd.DataFrame(forecasts)], ignore_index=True)
-        forecast_df['R_Squared'] = r_value ** 2
-        
-        return forecast_df
+        # Combine historical and forecast; both parts are built with their
+        # final columns so the concat is the only copy
+        historical = pd.DataFrame({
+            'Period': monthly['YearMonth'].astype(str).to_numpy(),
+            'Forecast': y,
+            'CI_Lower': y,
+            'CI_Upper': y,
+            'Type': pd.Categorical.from_codes(np.zeros(len(y), dtype=np.int8), dtype=_FORECAST_TYPE_DTYPE),
+            'R_Squared': r_squared
+        })
+        
+        return pd.concat([historical, forecasts], ignore_index=True)
     
     def cohort_analysis(self) -> pd.DataFrame:
         """
@@ -240,7 +335,7 @@ class PredictiveAnalyzer:
             if 'DaysToCollect' in self.df.columns and 'PaymentTerms' in self.df.columns:
                 self.df['PaymentVariance'] = self.df['DaysToCollect'] - self.df['PaymentTerms']
         
-        client_metrics = self.df.groupby('ClientName', as_index=False).agg({
+        client_metrics = self.df.groupby('ClientName', as_index=False, observed=True).agg({
             'InvoiceAmount': ['sum', 'mean', 'count'],
             'PaymentVariance': 'mean',
             'DaysOverdue': 'mean'
@@ -248,29 +343,23 @@ class PredictiveAnalyzer:
         client_metrics.columns = ['ClientName', 'TotalValue', 'AvgInvoice', 
                                    'InvoiceCount', 'AvgVariance', 'AvgDaysOverdue']
         
-        # Fill NAs
-        client_metrics = client_metrics.fillna(0)
+        # Fill NAs; sums and counts are never missing, only the means can be
+        means = ['AvgInvoice', 'AvgVariance', 'AvgDaysOverdue']
+        client_metrics[means] = client_metrics[means].fillna(0)
         
-        # Define cohorts based on behavior
-        def assign_cohort(row):
-            variance = row['AvgVariance']
-            value = row['TotalValue']
-            median_value = client_metrics['TotalValue'].median()
-            
-            if variance <= 0:
-                behavior = 'Early Payer'
-            elif variance <= 10:
-                behavior = 'On-Time Payer'
-            elif variance <= 30:
-                behavior = 'Slow Payer'
-            else:
-                behavior = 'Problem Payer'
-            
-            size = 'High Value' if value >= median_value else 'Low Value'
-            
-            return f'{size} - {behavior}'
+        # Define cohorts based on behavior, for all clients at once
+        variance = client_metrics['AvgVariance'].to_numpy()
+        value = client_metrics['TotalValue'].to_numpy()
+        median_value = np.median(value)
+        
+        behavior = np.select(
+            [variance <= 0, variance <= 10, variance <= 30],
+            ['Early Payer', 'On-Time Payer', 'Slow Payer'],
+            default='Problem Payer'
+        )
+        size = np.where(value >= median_value, 'High Value', 'Low Value')
         
-        client_metrics['Cohort'] = client_metrics.apply(assign_cohort, axis=1)
+        client_metrics['Cohort'] = np.char.add(np.char.add(size, ' - '), behavior)
         
         # Calculate cohort summaries
         cohort_summary = client_metrics.groupby('Cohort', as_index=False).agg({
@@ -297,50 +386,64 @@ class PredictiveAnalyzer:
         # Get recent payment behavior (last 3 months)
         if 'InvoiceDate' in self.df.columns:
             cutoff_date = self.df['InvoiceDate'].max() - timedelta(days=90)
-            recent_df = self.df[self.df['InvoiceDate'] >= cutoff_date]
+            is_recent = (self.df['InvoiceDate'] >= cutoff_date).to_numpy()
         else:
-            recent_df = self.df.tail(int(len(self.df) * 0.3))
-        
-        # Calculate recent variance
-        recent_metrics = recent_df.groupby('ClientName', as_index=False).agg({
-            'PaymentVariance': ['mean', 'std'],
-            'DaysOverdue': 'mean',
-            'InvoiceAmount': 'sum'
+            is_recent = np.zeros(len(self.df), dtype=bool)
+            is_recent[len(self.df) - int(len(self.df) * 0.3):] = True
+        
+        # Recent and historical metrics in one groupby: recent columns are
+        # masked to NaN outside the window, which the aggregations skip
+        variance = self.df['PaymentVariance']
+        metrics = pd.DataFrame({
+            'ClientName': self.df['ClientName'],
+            'IsRecent': is_recent,
+            'RecentVariance': variance.where(is_recent),
+            'RecentOverdue': self.df['DaysOverdue'].where(is_recent),
+            'RecentAmount': self.df['InvoiceAmount'].where(is_recent),
+            'Variance': variance
         })
-        recent_metrics.columns = ['ClientName', 'RecentAvgVariance', 'VarianceStd', 
-                                   'RecentAvgOverdue', 'RecentValue']
+        risk_df = metrics.groupby('ClientName', as_index=False, observed=True, sort=False).agg(
+            RecentAvgVariance=('RecentVariance', 'mean'),
+            VarianceStd=('RecentVariance', 'std'),
+            RecentAvgOverdue=('RecentOverdue', 'mean'),
+            RecentValue=('RecentAmount', 'sum'),
+            HistoricalAvgVariance=('Variance', 'mean'),
+            RecentCount=('IsRecent', 'sum')
+        )
         
-        # Calculate historical variance
-        historical_metrics = self.df.groupby('ClientName', as_index=False).agg({
-            'PaymentVariance': 'mean'
-        })
-        historical_metrics.columns = ['ClientName', 'HistoricalAvgVariance']
+        # Only clients invoiced inside the window are scored
+        risk_df = risk_df[risk_df['RecentCount'] > 0].drop(columns='RecentCount')
+        risk_df = risk_df.reset_index(drop=True).fillna(0)
         
-        # Merge and calculate trend
-        risk_df = recent_metrics.merge(historical_metrics, on='ClientName', how='left')
-        risk_df = risk_df.fillna(0)
+        recent_variance = risk_df['RecentAvgVariance'].to_numpy(dtype=float)
+        recent_overdue = risk_df['RecentAvgOverdue'].to_numpy(dtype=float)
         
         # Calculate trend (positive = deteriorating)
-        risk_df['VarianceTrend'] = risk_df['RecentAvgVariance'] - risk_df['HistoricalAvgVariance']
-        
-        # Risk probability score
-        risk_df['RiskProbability'] = (
-            risk_df['RecentAvgVariance'].clip(0, 100) / 100 * 0.4 +
-            risk_df['VarianceTrend'].clip(0, 50) / 50 * 0.3 +
-            risk_df['RecentAvgOverdue'].clip(0, 90) / 90 * 0.3
-        ).clip(0, 1)
-        
+        trend = recent_variance - risk_df['HistoricalAvgVariance'].to_numpy(dtype=float)
+        
+        # Risk probability score, accumulated in place over two buffers
+        # instead of one temporary per clip, divide and multiply
+        probability = np.clip(recent_variance, 0, 100)
+        probability /= 100
+        probability *= 0.4
+        term = np.clip(trend, 0, 50)
+        term /= 50
+        term *= 0.3
+        probability += term
+        np.clip(recent_overdue, 0, 90, out=term)
+        term /= 90
+        term *= 0.3
+        probability += term
+        np.clip(probability, 0, 1, out=probability)
+        
+        # Risk level bins are right-closed; a zero probability gets no level
+        level_codes = np.searchsorted(_RISK_LEVEL_EDGES, probability, side='left') - 1
+        
+        risk_df['VarianceTrend'] = trend
+        risk_df['RiskProbability'] = probability
         # Flag at-risk
-        risk_df['AtRisk'] = (
-            (risk_df['RecentAvgVariance'] > threshold_days) | 
-            (risk_df['VarianceTrend'] > 15)
-        )
-        
-        risk_df['RiskLevel'] = pd.cut(
-            risk_df['RiskProbability'],
-            bins=[0, 0.25, 0.5, 0.75, 1.0],
-            labels=['Low', 'Medium', 'High', 'Critical']
-        )
+        risk_df['AtRisk'] = (recent_variance > threshold_days) | (trend > 15)
+        risk_df['RiskLevel'] = pd.Categorical.from_codes(level_codes, dtype=_RISK_LEVEL_DTYPE)
         
         return risk_df.sort_values('RiskProbability', ascending=False)
     
@@ -368,13 +471,15 @@ class PredictiveAnalyzer:
         else:
             trend_direction = 'Insufficient Data'
         
+        is_forecast = forecast_data['Type'].to_numpy() == 'Forecast'
+        
         insights = {
             'trend_direction': trend_direction,
             'moving_average_current': ma_data['MovingAverage'].iloc[-1] if len(ma_data) > 0 else 0,
-            'forecast_next_quarter': forecast_data[forecast_data['Type'] == 'Forecast']['Forecast'].iloc[0] if len(forecast_data[forecast_data['Type'] == 'Forecast']) > 0 else 0,
+            'forecast_next_quarter': forecast_data['Forecast'].to_numpy()[is_forecast][0] if is_forecast.any() else 0,
             'r_squared': forecast_data['R_Squared'].iloc[0] if 'R_Squared' in forecast_data.columns else 0,
-            'at_risk_clients': len(at_risk[at_risk['AtRisk'] == True]),
-            'high_risk_clients': len(at_risk[at_risk['RiskLevel'] == 'Critical']),
+            'at_risk_clients': int(at_risk['AtRisk'].sum()),
+            'high_risk_clients': int((at_risk['RiskLevel'] == 'Critical').sum()),
             'cohort_breakdown': cohort_summary.to_dict('records') if len(cohort_summary) > 0 else [],
             'recommendations': self._generate_recommendations(trend_direction, at_risk, cohort_summary)
         }
@@ -389,13 +494,12 @@ class PredictiveAnalyzer:
         if trend == 'Declining':
             recommendations.append("Cash flow trend is declining - review collection processes")
         
-        high_risk_count = len(at_risk[at_risk['RiskLevel'].isin(['High', 'Critical'])])
+        high_risk_count = int(at_risk['RiskLevel'].isin(['High', 'Critical']).sum())
         if high_risk_count > 0:
             recommendations.append(f"Monitor {high_risk_count} high-risk clients for potential payment issues")
         
         if len(cohorts) > 0:
-            problem_cohorts = cohorts[cohorts['Cohort'].str.contains('Problem')]
-            if len(problem_cohorts) > 0:
+            if cohorts['Cohort'].str.contains('Problem').any():
                 recommendations.append("Consider credit limit adjustments for Problem Payer cohort")
         
         if not recommendations:
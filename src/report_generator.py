@@ -4,8 +4,10 @@ Report Generator Module
 Automated report creation and export utilities.
 """
 
+import importlib.util
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 import os
 import sys
@@ -14,6 +16,55 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
 
+@lru_cache(maxsize=1)
+def _excel_engine() -> str:
+    """
+    Excel engine for report workbooks, probed on first export.
+    
+    xlsxwriter streams rows to disk in constant_memory mode; openpyxl builds
+    the whole workbook in memory and is only the fallback. Neither is
+    imported until pandas opens the writer.
+    """
+    return 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+
+# Console health report, filled in one format_map call. Fields missing from
+# the analyzer reports fall back to the defaults below.
+_RULE = "=" * 60
+_HEALTH_TEMPLATE = f"""{_RULE}
+FINANCIAL HEALTH CHECK
+Generated: {{generated}}
+{_RULE}
+
+📊 ACCOUNTS RECEIVABLE
+  DSO: {{dso}} days
+  Total AR: ${{total_ar:,.2f}}
+  Total Overdue: ${{total_overdue:,.2f}}
+  Toxic Debt (90+): ${{toxic_debt_amount:,.2f}}
+  Health Score: {{health_score}}
+
+🔧 WORK-IN-PROGRESS
+  Total WIP Value: ${{total_wip_value:,.2f}}
+  Leakage Coefficient: {{leakage_percentage:.1f}}%
+  Stale WIP: ${{stale_wip_value:,.2f}}
+  WIP Status: {{health_status}}
+
+⚠️ CLIENT RISK
+  Clients Graded: {{total_clients_graded}}
+  High-Risk Clients: {{high_risk_client_count}}
+  High-Risk Exposure: ${{high_risk_value:,.2f}}
+  Portfolio Grade: {{portfolio_grade}}
+
+{_RULE}"""
+
+_DSO_DEFAULTS = {'dso': 'N/A', 'total_ar': 0, 'total_overdue': 0,
+                 'toxic_debt_amount': 0, 'health_score': 'N/A'}
+_WIP_DEFAULTS = {'total_wip_value': 0, 'leakage_percentage': 0,
+                 'stale_wip_value': 0, 'health_status': 'N/A'}
+_RISK_DEFAULTS = {'total_clients_graded': 0, 'high_risk_client_count': 0,
+                  'high_risk_value': 0, 'portfolio_grade': 'N/A'}
+
+
 class ReportGenerator:
     """Automated financial report generation and export."""
     
@@ -33,71 +84,99 @@ class ReportGenerator:
     def generate_health_report(self, dso_report: Dict, wip_report: Dict, 
                                 risk_report: Dict) -> str:
         """Generate console health report summary."""
-        report = []
-        report.append("=" * 60)
-        report.append("FINANCIAL HEALTH CHECK")
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 60)
-        
-        # DSO Section
-        report.append("\n📊 ACCOUNTS RECEIVABLE")
-        report.append(f"  DSO: {dso_report.get('dso', 'N/A')} days")
-        report.append(f"  Total AR: ${dso_report.get('total_ar', 0):,.2f}")
-        report.append(f"  Total Overdue: ${dso_report.get('total_overdue', 0):,.2f}")
-        report.append(f"  Toxic Debt (90+): ${dso_report.get('toxic_debt_amount', 0):,.2f}")
-        report.append(f"  Health Score: {dso_report.get('health_score', 'N/A')}")
-        
-        # WIP Section
-        report.append("\n🔧 WORK-IN-PROGRESS")
-        report.append(f"  Total WIP Value: ${wip_report.get('total_wip_value', 0):,.2f}")
-        report.append(f"  Leakage Coefficient: {wip_report.get('leakage_percentage', 0):.1f}%")
-        report.append(f"  Stale WIP: ${wip_report.get('stale_wip_value', 0):,.2f}")
-        report.append(f"  WIP Status: {wip_report.get('health_status', 'N/A')}")
-        
-        # Risk Section
-        report.append("\n⚠️ CLIENT RISK")
-        report.append(f"  Clients Graded: {risk_report.get('total_clients_graded', 0)}")
-        report.append(f"  High-Risk Clients: {risk_report.get('high_risk_client_count', 0)}")
-        report.append(f"  High-Risk Exposure: ${risk_report.get('high_risk_value', 0):,.2f}")
-        report.append(f"  Portfolio Grade: {risk_report.get('portfolio_grade', 'N/A')}")
-        
-        report.append("\n" + "=" * 60)
+        values = {'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        for report, defaults in ((dso_report, _DSO_DEFAULTS), (wip_report, _WIP_DEFAULTS),
+                                 (risk_report, _RISK_DEFAULTS)):
+            values.update({key: report.get(key, default) for key, default in defaults.items()})
         
-        return "\n".join(report)
+        return _HEALTH_TEMPLATE.format_map(values)
     
     def export_ar_snapshot(self, df: pd.DataFrame, prefix: str = None) -> str:
         """Export AR snapshot to CSV with timestamp."""
         prefix = prefix or config.AR_SNAPSHOT_PREFIX
         filename = f"{prefix}_{self._get_timestamp()}.csv"
         filepath = os.path.join(self.output_dir, filename)
-        df.to_csv(filepath, index=False)
+        
+        if config.CSV_ENGINE == 'pyarrow' and importlib.util.find_spec('pyarrow'):
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            try:
+                pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
+                return filepath
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                pass
+        
+        df.to_csv(filepath, index=False, chunksize=config.CSV_CHUNKSIZE)
         return filepath
     
-    def export_risk_report(self, graded_clients: pd.DataFrame, 
-                           distribution: pd.DataFrame,
-                           top_risk: pd.DataFrame) -> str:
-        """Export risk report to Excel with multiple sheets."""
-        filename = f"{config.RISK_REPORT_PREFIX}_{self._get_timestamp()}.xlsx"
-        filepath = os.path.join(self.output_dir, filename)
+    def _write_sheets(self, prefix: str, sheets: Dict[str, pd.DataFrame],
+                      fmt: str = 'xlsx') -> str:
+        """
+        Write named frames as sheets of one workbook, or as Parquet files.
+        
+        Args:
+            prefix: Report file prefix
+            sheets: Sheet name -> DataFrame, in sheet order
+            fmt: 'xlsx' for a workbook, 'parquet' for a directory holding one
+                zstd-compressed file per sheet
+            
+        Returns:
+            Path of the workbook or Parquet directory
+        """
+        stem = os.path.join(self.output_dir, f"{prefix}_{self._get_timestamp()}")
+        
+        if fmt == 'parquet':
+            os.makedirs(stem, exist_ok=True)
+            for name, df in sheets.items():
+                path = os.path.join(stem, name.lower().replace(' ', '_') + '.parquet')
+                df.to_parquet(path, index=False, compression='zstd')
+            return stem
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            graded_clients.to_excel(writer, sheet_name='Client Grades', index=False)
-            distribution.to_excel(writer, sheet_name='Grade Distribution', index=False)
-            top_risk.to_excel(writer, sheet_name='Top Risk Projects', index=False)
+        filepath = stem + '.xlsx'
+        engine = _excel_engine()
+        engine_kwargs = {'options': {'constant_memory': True}} if engine == 'xlsxwriter' else None
+        with pd.ExcelWriter(filepath, engine=engine, engine_kwargs=engine_kwargs) as writer:
+            for name, df in sheets.items():
+                df.to_excel(writer, sheet_name=name, index=False)
         
         return filepath
     
+    def export_risk_report(self, graded_clients: pd.DataFrame, 
+                           distribution: pd.DataFrame,
+                           top_risk: pd.DataFrame,
+                           fmt: str = 'xlsx') -> str:
+        """Export risk report to Excel with multiple sheets (or Parquet files)."""
+        return self._write_sheets(config.RISK_REPORT_PREFIX, {
+            'Client Grades': graded_clients,
+            'Grade Distribution': distribution,
+            'Top Risk Projects': top_risk
+        }, fmt)
+    
     def export_wip_report(self, wip_summary: pd.DataFrame,
-                          stale_wip: pd.DataFrame) -> str:
-        """Export WIP report to Excel."""
-        filename = f"{config.WIP_REPORT_PREFIX}_{self._get_timestamp()}.xlsx"
-        filepath = os.path.join(self.output_dir, filename)
+                          stale_wip: pd.DataFrame,
+                          fmt: str = 'xlsx') -> str:
+        """Export WIP report to Excel (or Parquet files)."""
+        return self._write_sheets(config.WIP_REPORT_PREFIX, {
+            'WIP Summary': wip_summary,
+            'Stale WIP': stale_wip
+        }, fmt)
+    
+    def export_all_excel(self, sheets: Dict[str, pd.DataFrame],
+                         prefix: Optional[str] = None) -> str:
+        """
+        Export any set of report frames as sheets of a single workbook.
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            wip_summary.to_excel(writer, sheet_name='WIP Summary', index=False)
-            stale_wip.to_excel(writer, sheet_name='Stale WIP', index=False)
+        Writing the risk and WIP sheets together pays the workbook setup and
+        zip serialization once instead of per report.
         
-        return filepath
+        Args:
+            sheets: Sheet name -> DataFrame, in sheet order
+            prefix: File prefix (defaults to config.COMBINED_REPORT_PREFIX)
+            
+        Returns:
+            Path of the written workbook
+        """
+        return self._write_sheets(prefix or config.COMBINED_REPORT_PREFIX, sheets)
     
     def export_executive_summary(self, dso_report: Dict, wip_report: Dict,
                                   risk_report: Dict) -> str:
@@ -15,6 +15,52 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+# Optional: Arrow-backed strings for text columns still held as objects
+try:
+    import pyarrow  # noqa: F401
+    _ARROW_STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    _ARROW_STRING_DTYPE = None
+
+# Grade thresholds pre-indexed as sorted arrays for vectorized grading
+_GRADE_ORDER = np.argsort(list(config.RISK_GRADE_THRESHOLDS.values()), kind='stable')
+_GRADE_BOUNDS = np.array(list(config.RISK_GRADE_THRESHOLDS.values()), dtype=float)[_GRADE_ORDER]
+_GRADE_LABELS = np.array(list(config.RISK_GRADE_THRESHOLDS.keys()), dtype=object)[_GRADE_ORDER]
+_GRADE_DTYPE = pd.CategoricalDtype([*_GRADE_LABELS, 'N/A'])
+
+# Portfolio grading: client grades as scores (N/A counts as C), and the
+# score edges between portfolio letters
+_GRADE_SCORES = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'F': 4, 'N/A': 2}
+_PORTFOLIO_EDGES = np.array([0.5, 1.5, 2.5, 3.5])
+_PORTFOLIO_LABELS = np.array(['A', 'B', 'C', 'D', 'F'], dtype=object)
+
+# Payment variance classes: right-closed day edges between the categories
+_VARIANCE_EDGES = np.array([0, 10, 30, 60], dtype=float)
+_VARIANCE_DTYPE = pd.CategoricalDtype(
+    ['Early/On-Time', 'Slightly Late', 'Late', 'Very Late', 'Severely Late'], ordered=True
+)
+
+# Low-cardinality text columns held as categoricals, and whole-day columns
+# downcast to the smallest integer type that fits
+_CATEGORY_COLUMNS = ('ClientName', 'ProjectName', 'Status')
+_DAY_COLUMNS = ('PaymentTerms', 'DaysToCollect', 'DaysOverdue', 'PaymentVariance')
+
+
+def grade_variance(variance) -> pd.Categorical:
+    """
+    Assign letter grades to an array of average variances in one pass.
+    
+    Args:
+        variance: Array-like of average days variance from terms
+        
+    Returns:
+        Categorical of grade letters ('N/A' where variance is missing)
+    """
+    values = pd.Series(variance).to_numpy(dtype=float, na_value=np.nan)
+    codes = np.minimum(np.searchsorted(_GRADE_BOUNDS, values, side='left'), len(_GRADE_LABELS) - 1)
+    codes[np.isnan(values)] = len(_GRADE_LABELS)
+    return pd.Categorical.from_codes(codes, dtype=_GRADE_DTYPE)
+
 
 class RiskScorer:
     """
@@ -37,7 +83,10 @@ class RiskScorer:
         Args:
             invoices_df: Cleaned invoices DataFrame with payment history
         """
-        self.df = invoices_df.copy()
+        # Shallow copy: columns are only ever replaced or added, never written
+        # in place, so the caller's frame stays untouched without a full copy
+        self.df = invoices_df.copy(deep=False)
+        self._graded_clients = None
         self._validate_and_prepare_data()
     
     def _validate_and_prepare_data(self):
@@ -45,72 +94,109 @@ class RiskScorer:
         # Calculate DaysToCollect if not present
         if 'DaysToCollect' not in self.df.columns:
             if 'PaidDate' in self.df.columns and 'InvoiceDate' in self.df.columns:
-                self.df['InvoiceDate'] = pd.to_datetime(self.df['InvoiceDate'])
-                self.df['PaidDate'] = pd.to_datetime(self.df['PaidDate'])
-                self.df['DaysToCollect'] = (self.df['PaidDate'] - self.df['InvoiceDate']).dt.days
+                for col in ('InvoiceDate', 'PaidDate'):
+                    if pd.api.types.is_datetime64_any_dtype(self.df[col]):
+                        continue
+                    try:
+                        self.df[col] = pd.to_datetime(self.df[col], format=config.SOURCE_DATE_FORMAT)
+                    except (ValueError, TypeError):
+                        self.df[col] = pd.to_datetime(self.df[col], format='mixed')
+                
+                # Whole days elapsed straight from the datetime64 arrays (NaN while unpaid)
+                elapsed = (self.df['PaidDate'].to_numpy(dtype='datetime64[ns]') -
+                           self.df['InvoiceDate'].to_numpy(dtype='datetime64[ns]'))
+                days = np.floor(elapsed / np.timedelta64(1, 'D'))
+                self.df['DaysToCollect'] = days if np.isnan(days).any() else days.astype(np.int64)
         
         # Calculate PaymentVariance if not present
         if 'PaymentVariance' not in self.df.columns:
             if 'DaysToCollect' in self.df.columns and 'PaymentTerms' in self.df.columns:
                 self.df['PaymentVariance'] = self.df['DaysToCollect'] - self.df['PaymentTerms']
+        
+        # Categorical codes and narrow integers for the grouped/compared columns
+        for col in _CATEGORY_COLUMNS:
+            if col not in self.df.columns or isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                continue
+            values = self.df[col]
+            if _ARROW_STRING_DTYPE is not None and pd.api.types.is_object_dtype(values):
+                values = values.astype(_ARROW_STRING_DTYPE)
+            self.df[col] = values.astype('category')
+        for col in _DAY_COLUMNS:
+            if col in self.df.columns and pd.api.types.is_integer_dtype(self.df[col]):
+                self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+        
+        # Normalize Status case once, per distinct value, merging categories
+        # that differ only by case, so filters compare category codes
+        status = self.df['Status']
+        lowered_codes, lowered = pd.factorize(status.cat.categories.str.casefold())
+        self.df['Status'] = pd.Categorical.from_codes(
+            np.append(lowered_codes, -1)[status.cat.codes.to_numpy()], categories=lowered
+        )
+        
+        # Paid invoices are the basis for every variance calculation
+        self._paid_mask = (self.df['Status'] == 'paid').to_numpy()
+        self._paid_df = self.df[self._paid_mask]
     
-    def calculate_payment_variance(self) -> pd.DataFrame:
+    def calculate_payment_variance(self, sort: bool = True) -> pd.DataFrame:
         """
         Calculate payment variance for each invoice.
         
         Variance = Actual Days to Pay - Contractual Terms
         
+        Args:
+            sort: Order by PaymentVariance, largest first (skip when order is irrelevant)
+            
         Returns:
             DataFrame with variance calculations
         """
-        df = self.df.copy()
-        
         # Only include paid invoices for variance calculation
-        paid_df = df[df['Status'].str.lower() == 'paid'].copy()
+        paid_df = self._paid_df
         
         if len(paid_df) == 0:
             return pd.DataFrame(columns=['InvoiceID', 'ClientName', 'PaymentVariance'])
         
         result = paid_df[['InvoiceID', 'ClientName', 'InvoiceAmount', 
-                          'PaymentTerms', 'DaysToCollect', 'PaymentVariance']].copy()
+                          'PaymentTerms', 'DaysToCollect', 'PaymentVariance']]
         
         # Classify variance
-        result['VarianceCategory'] = pd.cut(
-            result['PaymentVariance'],
-            bins=[-float('inf'), 0, 10, 30, 60, float('inf')],
-            labels=['Early/On-Time', 'Slightly Late', 'Late', 'Very Late', 'Severely Late']
-        )
+        variance = result['PaymentVariance'].to_numpy(dtype=float, na_value=np.nan)
+        codes = np.searchsorted(_VARIANCE_EDGES, variance, side='left')
+        codes[np.isnan(variance)] = -1
+        result = result.assign(VarianceCategory=pd.Categorical.from_codes(codes, dtype=_VARIANCE_DTYPE))
         
-        return result.sort_values('PaymentVariance', ascending=False)
+        return result.sort_values('PaymentVariance', ascending=False) if sort else result
     
-    def grade_clients(self) -> pd.DataFrame:
+    def grade_clients(self, sort: bool = True) -> pd.DataFrame:
         """
         Assign risk grades (A-F) to each client.
         
+        Args:
+            sort: Order by AvgVariance, worst first (skip when order is irrelevant)
+            
         Returns:
             DataFrame with ClientName, AvgVariance, Grade, GradeDescription
         """
+        # The data does not change after __init__, so grade once per scorer
+        if self._graded_clients is None:
+            self._graded_clients = self._compute_client_grades()
+        if sort:
+            return self._graded_clients.sort_values('AvgVariance', ascending=False)
+        return self._graded_clients.copy(deep=False)
+    
+    def _compute_client_grades(self) -> pd.DataFrame:
+        """Group paid invoices by client and assign grades."""
         # Get paid invoices with variance data
-        paid_df = self.df[
-            (self.df['Status'].str.lower() == 'paid') & 
-            (self.df['PaymentVariance'].notna())
-        ].copy()
+        paid_df = self._paid_df[self._paid_df['PaymentVariance'].notna()]
         
         if len(paid_df) == 0:
             # If no paid invoices, grade based on overdue status
             return self._grade_by_overdue_status()
         
         # Calculate average variance per client
-        client_stats = paid_df.groupby('ClientName', as_index=False).agg({
-            'PaymentVariance': ['mean', 'std', 'count'],
-            'InvoiceAmount': 'sum'
-        })
-        
-        client_stats.columns = ['ClientName', 'AvgVariance', 'StdVariance', 
-                                'InvoiceCount', 'TotalValue']
+        client_stats = self._client_variance_stats(paid_df)
         
         # Assign grades
-        client_stats['Grade'] = client_stats['AvgVariance'].apply(self._assign_grade)
+        client_stats['Grade'] = grade_variance(client_stats['AvgVariance'])
         client_stats['GradeDescription'] = client_stats['Grade'].map(config.RISK_GRADE_DESCRIPTIONS)
         
         # Calculate risk score (0-100)
@@ -120,24 +206,111 @@ class RiskScorer:
         else:
             client_stats['RiskScore'] = 0
         
-        return client_stats.sort_values('AvgVariance', ascending=False)
+        return client_stats
+    
+    @staticmethod
+    def _client_variance_stats(paid_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-client variance mean/std/count and invoice total in one pass.
+        
+        Args:
+            paid_df: Paid invoices with a non-null PaymentVariance
+            
+        Returns:
+            DataFrame with ClientName, AvgVariance, StdVariance, InvoiceCount, TotalValue
+        """
+        codes, clients = pd.factorize(paid_df['ClientName'], sort=True)
+        keep = codes >= 0
+        codes = codes[keep]
+        variance = paid_df['PaymentVariance'].to_numpy(dtype=float)[keep]
+        amounts = paid_df['InvoiceAmount'].to_numpy(dtype=float, na_value=0.0)[keep]
+        n = len(clients)
+        
+        counts = np.bincount(codes, minlength=n)
+        mean = np.bincount(codes, weights=variance, minlength=n) / counts
+        # Sample std (ddof=1) from squared deviations about each client's mean
+        sq_dev = np.bincount(codes, weights=(variance - mean[codes]) ** 2, minlength=n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.where(counts > 1, np.sqrt(sq_dev / (counts - 1)), np.nan)
+        
+        return pd.DataFrame({
+            'ClientName': clients,
+            'AvgVariance': mean,
+            'StdVariance': std,
+            'InvoiceCount': counts,
+            'TotalValue': np.bincount(codes, weights=amounts, minlength=n)
+        })
+    
+    @staticmethod
+    def _project_risk_stats(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-project invoice total, worst overdue days and mean variance in one pass.
+        
+        Args:
+            df: Invoices with ProjectName, InvoiceAmount, DaysOverdue, PaymentVariance
+            
+        Returns:
+            DataFrame with ProjectName, TotalValue, MaxDaysOverdue, AvgVariance
+        """
+        codes, projects = pd.factorize(df['ProjectName'], sort=True)
+        keep = codes >= 0
+        codes = codes[keep]
+        n = len(projects)
+        if n == 0:
+            return pd.DataFrame(columns=['ProjectName', 'TotalValue', 'MaxDaysOverdue', 'AvgVariance'])
+        
+        amounts = df['InvoiceAmount'].to_numpy(dtype=float, na_value=0.0)[keep]
+        variance = df['PaymentVariance'].to_numpy(dtype=float, na_value=np.nan)[keep]
+        has_variance = ~np.isnan(variance)
+        
+        # Max overdue per project over rows grouped by code; fmax skips NaN
+        if pd.api.types.is_integer_dtype(df['DaysOverdue']) and not df['DaysOverdue'].hasnans:
+            days = df['DaysOverdue'].to_numpy()[keep]
+        else:
+            days = df['DaysOverdue'].to_numpy(dtype=float, na_value=np.nan)[keep]
+        order = np.argsort(codes, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+        max_days = np.fmax.reduceat(days[order], starts)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_variance = (np.bincount(codes[has_variance], weights=variance[has_variance], minlength=n)
+                            / np.bincount(codes[has_variance], minlength=n))
+        
+        return pd.DataFrame({
+            'ProjectName': projects,
+            'TotalValue': np.bincount(codes, weights=amounts, minlength=n),
+            'MaxDaysOverdue': max_days,
+            'AvgVariance': avg_variance
+        })
     
     def _grade_by_overdue_status(self) -> pd.DataFrame:
         """
         Grade clients based on current overdue amount when no payment history.
         """
-        client_stats = self.df.groupby('ClientName', as_index=False).agg({
-            'InvoiceAmount': 'sum',
-            'DaysOverdue': 'mean'
+        codes, clients = pd.factorize(self.df['ClientName'], sort=True)
+        keep = codes >= 0
+        codes = codes[keep]
+        n = len(clients)
+        amounts = self.df['InvoiceAmount'].to_numpy(dtype=float, na_value=0.0)[keep]
+        overdue = self.df['DaysOverdue'].to_numpy(dtype=float, na_value=np.nan)[keep]
+        has_overdue = ~np.isnan(overdue)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_overdue = (np.bincount(codes[has_overdue], weights=overdue[has_overdue], minlength=n)
+                           / np.bincount(codes[has_overdue], minlength=n))
+        
+        client_stats = pd.DataFrame({
+            'ClientName': clients,
+            'TotalValue': np.bincount(codes, weights=amounts, minlength=n),
+            'AvgDaysOverdue': avg_overdue
         })
-        client_stats.columns = ['ClientName', 'TotalValue', 'AvgDaysOverdue']
         
         client_stats['AvgVariance'] = client_stats['AvgDaysOverdue']
-        client_stats['Grade'] = client_stats['AvgVariance'].apply(self._assign_grade)
+        client_stats['Grade'] = grade_variance(client_stats['AvgVariance'])
         client_stats['GradeDescription'] = client_stats['Grade'].map(config.RISK_GRADE_DESCRIPTIONS)
         client_stats['RiskScore'] = (client_stats['AvgVariance'] / 90 * 100).clip(0, 100).round(1)
         
-        return client_stats.sort_values('AvgVariance', ascending=False)
+        return client_stats
     
     def _assign_grade(self, avg_variance: float) -> str:
         """
@@ -152,11 +325,8 @@ class RiskScorer:
         if pd.isna(avg_variance):
             return 'N/A'
         
-        for grade, threshold in config.RISK_GRADE_THRESHOLDS.items():
-            if avg_variance <= threshold:
-                return grade
-        
-        return 'F'
+        idx = np.searchsorted(_GRADE_BOUNDS, avg_variance, side='left')
+        return _GRADE_LABELS[idx] if idx < len(_GRADE_LABELS) else 'F'
     
     def get_top_risk_projects(self, n: int = 10) -> pd.DataFrame:
         """
@@ -169,46 +339,67 @@ class RiskScorer:
             DataFrame with highest-risk projects
         """
         # Calculate risk at project level
-        project_risk = self.df.groupby('ProjectName', as_index=False).agg({
-            'InvoiceAmount': 'sum',
-            'DaysOverdue': 'max',
-            'PaymentVariance': 'mean'
-        })
-        project_risk.columns = ['ProjectName', 'TotalValue', 'MaxDaysOverdue', 'AvgVariance']
-        
-        # Composite risk score
-        project_risk['RiskScore'] = (
-            project_risk['MaxDaysOverdue'].fillna(0) * 0.5 +
-            project_risk['AvgVariance'].fillna(0) * 0.5
-        ).clip(0, 100)
-        
-        project_risk['Grade'] = project_risk['RiskScore'].apply(
-            lambda x: self._assign_grade(x) if pd.notna(x) else 'N/A'
-        )
+        project_risk = self._project_risk_stats(self.df)
+        
+        # Composite risk score, accumulated and clipped in one buffer
+        # (nan_to_num returns fresh buffers, so the frame's own columns are never written)
+        scores = np.nan_to_num(project_risk['MaxDaysOverdue'].to_numpy(dtype=float, na_value=np.nan), nan=0.0)
+        scores *= 0.5
+        term = np.nan_to_num(project_risk['AvgVariance'].to_numpy(dtype=float, na_value=np.nan), nan=0.0)
+        term *= 0.5
+        scores += term
+        np.clip(scores, 0, 100, out=scores)
+        project_risk['RiskScore'] = scores
+        
+        # Top n by partial selection; ties keep row order, as nlargest does
+        n = max(0, min(n, len(scores)))
+        if n == 0:
+            idx = np.arange(0)
+        elif n < len(scores):
+            kth = np.partition(scores, len(scores) - n)[len(scores) - n]
+            above = np.flatnonzero(scores > kth)
+            ties = np.flatnonzero(scores == kth)[:n - len(above)]
+            idx = np.sort(np.concatenate([above, ties]))
+        else:
+            idx = np.arange(n)
+        idx = idx[np.argsort(-scores[idx], kind='stable')]
         
-        return project_risk.nlargest(n, 'RiskScore')
+        top = project_risk.iloc[idx]
+        return top.assign(Grade=grade_variance(top['RiskScore']))
     
-    def get_risk_distribution(self) -> pd.DataFrame:
+    def get_risk_distribution(self, graded_clients: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Get distribution of clients across risk grades.
         
+        Args:
+            graded_clients: Output of grade_clients() to reuse (graded here if None)
+            
         Returns:
             DataFrame with Grade, Count, TotalValue, Percentage
         """
-        graded_clients = self.grade_clients()
-        
-        distribution = graded_clients.groupby('Grade', as_index=False).agg({
-            'ClientName': 'count',
-            'TotalValue': 'sum'
-        })
-        distribution.columns = ['Grade', 'ClientCount', 'TotalValue']
+        if graded_clients is None:
+            graded_clients = self.grade_clients(sort=False)
+        
+        # Histogram over the grade codes; every grade gets a row, empty or not
+        codes = graded_clients['Grade'].cat.codes.to_numpy()
+        n_codes = len(_GRADE_DTYPE.categories)
+        counts = np.bincount(codes, minlength=n_codes)
+        values = np.bincount(
+            codes, weights=graded_clients['TotalValue'].to_numpy(dtype=float, na_value=0.0),
+            minlength=n_codes
+        )
         
-        total_value = distribution['TotalValue'].sum()
-        distribution['ValuePercentage'] = (distribution['TotalValue'] / total_value * 100).round(1)
+        total_value = values.sum()
+        percentages = (values / total_value * 100).round(1) if total_value else np.zeros(n_codes)
         
-        # Ensure all grades are represented
-        all_grades = pd.DataFrame({'Grade': list(config.RISK_GRADE_THRESHOLDS.keys())})
-        distribution = all_grades.merge(distribution, on='Grade', how='left').fillna(0)
+        grades = list(config.RISK_GRADE_THRESHOLDS.keys())
+        idx = _GRADE_DTYPE.categories.get_indexer(grades)
+        distribution = pd.DataFrame({
+            'Grade': grades,
+            'ClientCount': counts[idx],
+            'TotalValue': values[idx],
+            'ValuePercentage': percentages[idx]
+        })
         distribution['GradeDescription'] = distribution['Grade'].map(config.RISK_GRADE_DESCRIPTIONS)
         
         return distribution
@@ -220,23 +411,27 @@ class RiskScorer:
         Returns:
             Dictionary with risk metrics and analysis
         """
-        graded_clients = self.grade_clients()
-        distribution = self.get_risk_distribution()
+        graded_clients = self.grade_clients(sort=False)
+        distribution = self.get_risk_distribution(graded_clients)
         top_risk = self.get_top_risk_projects()
         
-        # Calculate high-risk exposure
-        high_risk_clients = graded_clients[graded_clients['Grade'].isin(['D', 'F'])]
-        high_risk_value = high_risk_clients['TotalValue'].sum() if len(high_risk_clients) > 0 else 0
-        total_value = graded_clients['TotalValue'].sum()
+        # Calculate high-risk exposure straight from the column arrays
+        values = graded_clients['TotalValue'].to_numpy(dtype=float, na_value=0.0)
+        variances = graded_clients['AvgVariance'].to_numpy(dtype=float, na_value=np.nan)
+        variances = variances[~np.isnan(variances)]
+        high_risk_mask = graded_clients['Grade'].isin(['D', 'F']).to_numpy()
+        high_risk_count = int(high_risk_mask.sum())
+        high_risk_value = values[high_risk_mask].sum() if high_risk_count > 0 else 0
+        total_value = values.sum()
         
         report = {
             'total_clients_graded': len(graded_clients),
             'grade_distribution': distribution.to_dict('records'),
-            'high_risk_client_count': len(high_risk_clients),
+            'high_risk_client_count': high_risk_count,
             'high_risk_value': high_risk_value,
             'high_risk_percentage': (high_risk_value / total_value * 100) if total_value > 0 else 0,
             'top_risk_projects': top_risk.head(5).to_dict('records'),
-            'average_variance': graded_clients['AvgVariance'].mean() if len(graded_clients) > 0 else 0,
+            'average_variance': variances.mean() if len(variances) > 0 else 0,
             'portfolio_grade': self._calculate_portfolio_grade(graded_clients)
         }
         
@@ -249,51 +444,40 @@ class RiskScorer:
         if len(graded_clients) == 0:
             return 'N/A'
         
-        grade_values = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'F': 4, 'N/A': 2}
-        
         total_value = graded_clients['TotalValue'].sum()
         if total_value == 0:
             return 'N/A'
         
-        weighted_score = sum(
-            grade_values.get(row['Grade'], 2) * row['TotalValue']
-            for _, row in graded_clients.iterrows()
-        ) / total_value
-        
-        if weighted_score <= 0.5:
-            return 'A'
-        elif weighted_score <= 1.5:
-            return 'B'
-        elif weighted_score <= 2.5:
-            return 'C'
-        elif weighted_score <= 3.5:
-            return 'D'
-        else:
-            return 'F'
+        scores = graded_clients['Grade'].map(_GRADE_SCORES).to_numpy(dtype=float, na_value=2)
+        values = graded_clients['TotalValue'].to_numpy(dtype=float)
+        weighted_score = (scores @ values) / total_value
+        
+        return _PORTFOLIO_LABELS[np.searchsorted(_PORTFOLIO_EDGES, weighted_score, side='left')]
     
-    def get_watch_list(self, grade_threshold: str = 'C') -> pd.DataFrame:
+    def get_watch_list(self, grade_threshold: str = 'C', sort: bool = True) -> pd.DataFrame:
         """
         Get list of clients that need monitoring.
         
         Args:
             grade_threshold: Minimum grade to include (C, D, or F)
+            sort: Order by RiskScore, highest first (skip when order is irrelevant)
             
         Returns:
             DataFrame with clients requiring attention
         """
-        graded = self.grade_clients()
+        graded = self.grade_clients(sort=sort)
         
         grades_to_watch = {'C': ['C', 'D', 'F'], 'D': ['D', 'F'], 'F': ['F']}
         watch_grades = grades_to_watch.get(grade_threshold, ['C', 'D', 'F'])
         
-        watch_list = graded[graded['Grade'].isin(watch_grades)].copy()
-        watch_list['ActionRequired'] = watch_list['Grade'].map({
+        watch_list = graded[graded['Grade'].isin(watch_grades)]
+        watch_list = watch_list.assign(ActionRequired=watch_list['Grade'].map({
             'C': 'Monitor closely',
             'D': 'Escalate to management',
             'F': 'Collection action required'
-        })
+        }))
         
-        return watch_list.sort_values('RiskScore', ascending=False)
+        return watch_list.sort_values('RiskScore', ascending=False) if sort else watch_list
 
 
 # =============================================================================
@@ -312,9 +496,10 @@ if __name__ == "__main__":
         'InvoiceAmount': [10000, 15000, 20000, 8000, 12000] * 3,
         'Status': ['Paid'] * 12 + ['Overdue'] * 3,
         'PaymentTerms': [30] * 15,
-        'DaysToCollect': [25, 28, 32, 35, 30,  # Client A - Good
-                          45, 52, 60, 55, 48,  # Client B - Watch
-                          75, 82, 90, None, None],  # Client C - At Risk
+        'DaysToCollect': pd.array([25, 28, 32, 35, 30,  # Client A - Good
+                                   45, 52, 60, 55, 48,  # Client B - Watch
+                                   75, 82, 90, None, None],  # Client C - At Risk
+                                  dtype='Int32'),
         'DaysOverdue': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 45, 60, 75]
     })
     
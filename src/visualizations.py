@@ -1,57 +1,225 @@
 """
 Visualizations Module
 =====================
-Professional financial visualizations using matplotlib and seaborn.
+Professional financial visualizations using matplotlib.
+
+pyplot is imported on first use, so importing this module (or building
+the chart task list) does not pay matplotlib's start-up cost.
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+# Currency magnitudes, largest first: (threshold, suffix, decimals)
+_CURRENCY_SCALES = ((1_000_000_000, 'B', 1), (1_000_000, 'M', 1), (1_000, 'K', 0))
+
+# Forecast row labels, in the code order the forecasts are built with
+_FORECAST_TYPE_DTYPE = pd.CategoricalDtype(list(config.FORECAST_TYPES))
+
+# The chart style is global matplotlib state, so it is applied once per process
+_STYLE_APPLIED = False
+
+
+@lru_cache(maxsize=1024)
+def _format_currency(value: float) -> str:
+    """Format one value; axis ticks repeat the same handful of values."""
+    for threshold, suffix, decimals in _CURRENCY_SCALES:
+        if abs(value) >= threshold:
+            return f'${value / threshold:.{decimals}f}{suffix}'
+    return f'${value:.0f}'
+
 
 def format_currency(value, pos=None):
     """Consistent currency formatter for all charts."""
-    if abs(value) >= 1_000_000_000:
-        return f'${value/1_000_000_000:.1f}B'
-    elif abs(value) >= 1_000_000:
-        return f'${value/1_000_000:.1f}M'
-    elif abs(value) >= 1_000:
-        return f'${value/1_000:.0f}K'
-    else:
-        return f'${value:.0f}'
+    return _format_currency(float(value))
+
+
+def format_currency_array(values) -> list:
+    """
+    Format a whole array of values the way format_currency formats one.
+    
+    Args:
+        values: Array-like of amounts (e.g. an axis's tick locations)
+        
+    Returns:
+        List of currency label strings
+    """
+    values = np.asarray(values, dtype=float)
+    magnitude = np.abs(values)
+    conditions = [magnitude >= threshold for threshold, _, _ in _CURRENCY_SCALES]
+    scale = np.select(conditions, [threshold for threshold, _, _ in _CURRENCY_SCALES], default=1)
+    scale_idx = np.select(conditions, list(range(len(_CURRENCY_SCALES))), default=len(_CURRENCY_SCALES))
+    templates = [f'${{:.{decimals}f}}{suffix}' for _, suffix, decimals in _CURRENCY_SCALES] + ['${:.0f}']
+    return [templates[i].format(v) for i, v in zip(scale_idx, values / scale)]
+
+
+def _top_n_positions(values, n: int) -> np.ndarray:
+    """
+    Positions of the n largest values by partial selection, largest first.
+    
+    Ties keep row order and NaN only fills the tail, matching DataFrame.nlargest.
+    
+    Args:
+        values: Array-like of numbers
+        n: How many positions to return
+        
+    Returns:
+        Integer position array
+    """
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    valid = np.flatnonzero(~missing)
+    candidates = values[valid]
+    n = max(0, n)
+    if n >= len(candidates):
+        order = valid[np.argsort(-candidates, kind='stable')]
+        return np.concatenate([order, np.flatnonzero(missing)[:n - len(candidates)]])
+    if n == 0:
+        return valid[:0]
+    kth = np.partition(candidates, len(candidates) - n)[len(candidates) - n]
+    above = np.flatnonzero(candidates > kth)
+    ties = np.flatnonzero(candidates == kth)[:n - len(above)]
+    chosen = np.sort(np.concatenate([above, ties]))
+    return valid[chosen[np.argsort(-candidates[chosen], kind='stable')]]
+
+
+def _pyplot():
+    """matplotlib.pyplot, imported on first use."""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _currency_formatter():
+    """Shared tick formatter that labels all of an axis's ticks in one pass."""
+    from matplotlib.ticker import FuncFormatter
+    
+    class CurrencyFormatter(FuncFormatter):
+        def format_ticks(self, values):
+            return format_currency_array(values)
+    
+    return CurrencyFormatter(format_currency)
+
+
+def _apply_chart_style():
+    """Apply the configured chart style the first time a visualizer is built."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    plt = _pyplot()
+    try:
+        plt.style.use(config.CHART_STYLE)
+    except OSError:
+        plt.style.use('seaborn-v0_8-whitegrid')
+    _STYLE_APPLIED = True
 
 
 class FinancialVisualizer:
     """Professional visualization suite for financial analytics."""
     
+    # Shared by every chart and instance; the formatter holds no per-axis state.
+    # Built with the first visualizer, once matplotlib is loaded
+    CURRENCY_FORMATTER = None
+    
+    # Charts that lay out their own multi-panel figure (no ax= support)
+    _OWN_FIGURE_CHARTS = frozenset({'plot_predictive_dashboard'})
+    
     def __init__(self, figsize: Tuple[int, int] = (12, 6)):
         self.figsize = figsize
         self.dpi = config.FIGURE_DPI
-        self.currency_formatter = plt.FuncFormatter(format_currency)
-        try:
-            plt.style.use(config.CHART_STYLE)
-        except:
-            plt.style.use('seaborn-v0_8-whitegrid')
+        _apply_chart_style()
+        if FinancialVisualizer.CURRENCY_FORMATTER is None:
+            FinancialVisualizer.CURRENCY_FORMATTER = _currency_formatter()
 
     
+    @staticmethod
+    def _figure(figsize: Tuple[int, int], ax: Optional[plt.Axes] = None):
+        """
+        Figure and axes to draw one chart on.
+        
+        Args:
+            figsize: Chart size in inches
+            ax: Existing axes to draw on (resized to figsize); a new figure if None
+            
+        Returns:
+            Tuple of (figure, axes)
+        """
+        if ax is None:
+            return _pyplot().subplots(figsize=figsize)
+        ax.figure.set_size_inches(figsize)
+        return ax.figure, ax
+    
+    @staticmethod
+    def _split_forecast(forecast_data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split forecast output into its historical and forecast rows.
+        
+        The Type column is compared once as categorical codes; forecasts from
+        PredictiveAnalyzer already carry that dtype, so no strings are scanned.
+        
+        Args:
+            forecast_data: DataFrame with a Type column
+            
+        Returns:
+            Tuple of (historical, future) DataFrames
+        """
+        codes = forecast_data['Type'].astype(_FORECAST_TYPE_DTYPE).cat.codes.to_numpy()
+        return forecast_data[codes == 0], forecast_data[codes == 1]
+    
+    def render_batch(self, chart_tasks: List[Tuple[str, tuple, str]]) -> List[str]:
+        """
+        Render several charts in sequence on one reused figure.
+        
+        Each single-axes chart is drawn on fresh axes of the same figure and
+        saved; the multi-panel dashboard still builds (and closes) its own figure.
+        
+        Args:
+            chart_tasks: (method name, positional args, save path) per chart
+            
+        Returns:
+            List of saved file paths
+        """
+        plt = _pyplot()
+        fig = plt.figure(figsize=self.figsize)
+        try:
+            for method, args, save_path in chart_tasks:
+                if method in self._OWN_FIGURE_CHARTS:
+                    plt.close(getattr(self, method)(*args, save_path=save_path))
+                    continue
+                # Start each chart from a blank figure with default margins, so
+                # aspect and tight_layout state never leak between charts
+                fig.clear()
+                fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                                       for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+                getattr(self, method)(*args, save_path=save_path, ax=fig.add_subplot())
+        finally:
+            plt.close(fig)
+        return [save_path for _, _, save_path in chart_tasks]
+    
     def plot_aging_buckets(self, aging_summary: pd.DataFrame, 
-                           save_path: Optional[str] = None) -> plt.Figure:
+                           save_path: Optional[str] = None,
+                           ax: Optional[plt.Axes] = None) -> plt.Figure:
         """Create bar chart for aging bucket distribution."""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._figure(self.figsize, ax)
         
         bucket_order = config.BUCKET_LABELS
         aging_summary = aging_summary.set_index('AgingBucket').reindex(bucket_order).reset_index()
         
         bars = ax.bar(aging_summary['AgingBucket'], aging_summary['Amount'], 
-                      color=config.AGING_COLORS, edgecolor='white')
+                      color=config.AGING_COLORS, edgecolor='white', rasterized=True)
         
         ax.set_title('AR Amount by Aging Bucket', fontsize=14, fontweight='bold')
         ax.set_xlabel('Aging Bucket')
@@ -64,15 +232,16 @@ class FinancialVisualizer:
                            xy=(bar.get_x() + bar.get_width()/2, bar.get_height()),
                            ha='center', va='bottom', fontsize=10)
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_dso_trend(self, trend_data: pd.DataFrame,
-                       save_path: Optional[str] = None) -> plt.Figure:
+                       save_path: Optional[str] = None,
+                       ax: Optional[plt.Axes] = None) -> plt.Figure:
         """Create line chart with DSO trend."""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._figure(self.figsize, ax)
         
         ax.plot(trend_data['Period'], trend_data['DSO'], 
                 marker='o', linewidth=2, color=config.COLOR_PALETTE['primary'], label='DSO')
@@ -90,20 +259,24 @@ class FinancialVisualizer:
         ax.tick_params(axis='x', rotation=45)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_wip_leakage(self, wip_data: pd.DataFrame, top_n: int = 10,
-                         save_path: Optional[str] = None) -> plt.Figure:
+                         save_path: Optional[str] = None,
+                         ax: Optional[plt.Axes] = None) -> plt.Figure:
         """Create horizontal bar chart for WIP by project."""
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = self._figure((12, 8), ax)
         
-        plot_data = wip_data.nlargest(top_n, 'UnbilledValue').sort_values('UnbilledValue')
+        # Top n by partial selection, then drawn smallest first (bottom to top)
+        values = wip_data['UnbilledValue'].to_numpy(dtype=float, na_value=np.nan)
+        top = _top_n_positions(values, top_n)
+        plot_data = wip_data.iloc[top[np.argsort(values[top], kind='stable')]]
         
         bars = ax.barh(plot_data['ProjectName'], plot_data['UnbilledValue'],
-                      color=config.COLOR_PALETTE['danger'], height=0.7)
+                      color=config.COLOR_PALETTE['danger'], height=0.7, rasterized=True)
         
         ax.set_title('Work-in-Progress Leakage Analysis', fontsize=14, fontweight='bold')
         ax.set_xlabel('Unbilled Value ($)')
@@ -113,15 +286,16 @@ class FinancialVisualizer:
             ax.annotate(f'${width:,.0f}', xy=(width, bar.get_y() + bar.get_height()/2),
                        xytext=(5, 0), textcoords='offset points', ha='left', va='center')
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_client_grades(self, grade_distribution: pd.DataFrame,
-                           save_path: Optional[str] = None) -> plt.Figure:
+                           save_path: Optional[str] = None,
+                           ax: Optional[plt.Axes] = None) -> plt.Figure:
         """Create pie chart for client risk grades."""
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._figure((10, 8), ax)
         
         plot_data = grade_distribution[grade_distribution['ClientCount'] > 0]
         if len(plot_data) == 0:
@@ -134,54 +308,58 @@ class FinancialVisualizer:
                wedgeprops=dict(width=0.6))
         ax.set_title('Client Risk Grade Distribution', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_forecast(self, forecast_data: pd.DataFrame,
-                      save_path: Optional[str] = None) -> plt.Figure:
+                      save_path: Optional[str] = None,
+                      ax: Optional[plt.Axes] = None) -> plt.Figure:
         """Create forecast chart with confidence bands."""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._figure(self.figsize, ax)
         
-        historical = forecast_data[forecast_data['Type'] == 'Historical']
-        future = forecast_data[forecast_data['Type'] == 'Forecast']
+        historical, future = self._split_forecast(forecast_data)
+        hist_vals = historical['Forecast'].to_numpy()
+        fut_vals = future['Forecast'].to_numpy()
+        n_hist, n_future = hist_vals.size, fut_vals.size
         
-        if len(historical) > 0:
-            ax.plot(range(len(historical)), historical['Forecast'],
+        if n_hist > 0:
+            ax.plot(np.arange(n_hist), hist_vals,
                    marker='o', linewidth=2, color=config.COLOR_PALETTE['primary'], label='Historical')
         
-        if len(future) > 0:
-            future_x = range(len(historical), len(historical) + len(future))
-            ax.plot(future_x, future['Forecast'], marker='s', linewidth=2,
+        if n_future > 0:
+            future_x = np.arange(n_hist, n_hist + n_future)
+            ax.plot(future_x, fut_vals, marker='s', linewidth=2,
                    color=config.COLOR_PALETTE['warning'], label='Forecast')
-            ax.fill_between(future_x, future['CI_Lower'], future['CI_Upper'],
-                          alpha=0.2, color=config.COLOR_PALETTE['warning'])
+            ax.fill_between(future_x, future['CI_Lower'].to_numpy(), future['CI_Upper'].to_numpy(),
+                          alpha=0.2, color=config.COLOR_PALETTE['warning'], rasterized=True)
         
         ax.set_title('Quarterly Cash Inflow Forecast', fontsize=14, fontweight='bold')
         ax.set_xlabel('Period')
         ax.set_ylabel('Cash Inflow ($)')
         ax.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_trend_with_bars(self, trend_data: pd.DataFrame,
-                              save_path: Optional[str] = None) -> plt.Figure:
+                              save_path: Optional[str] = None,
+                              ax: Optional[plt.Axes] = None) -> plt.Figure:
         """
         Create combined chart: bars for values + line for moving average.
         Perfect for predictive analytics visualization.
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        fig, ax = self._figure((14, 7), ax)
         
         x = range(len(trend_data))
         
         # Bar chart for actual values
         bars = ax.bar(x, trend_data['Value'], 
                      color=config.COLOR_PALETTE['secondary'], 
-                     alpha=0.7, label='Quarterly Value', width=0.6)
+                     alpha=0.7, label='Quarterly Value', width=0.6, rasterized=True)
         
         # Line chart for moving average
         if 'MovingAverage' in trend_data.columns:
@@ -192,13 +370,17 @@ class FinancialVisualizer:
         
         # Trend indicators
         if 'Trend' in trend_data.columns:
-            for i, (val, trend) in enumerate(zip(trend_data['Value'], trend_data['Trend'])):
-                if pd.notna(trend):
-                    arrow = '↑' if trend == 'Up' else '↓'
-                    color = 'green' if trend == 'Up' else 'red'
-                    ax.annotate(arrow, xy=(i, val), 
-                               xytext=(0, 10), textcoords='offset points',
-                               ha='center', fontsize=14, color=color, fontweight='bold')
+            # Positions, arrows and colours worked out as arrays; the loop only places text
+            trends = trend_data['Trend']
+            shown = np.flatnonzero(trends.notna().to_numpy())
+            is_up = trends.to_numpy()[shown] == 'Up'
+            values = trend_data['Value'].to_numpy()[shown]
+            arrows = np.where(is_up, '↑', '↓')
+            colors = np.where(is_up, 'green', 'red')
+            arrow_style = dict(xytext=(0, 10), textcoords='offset points',
+                               ha='center', fontsize=14, fontweight='bold')
+            for i, val, arrow, color in zip(shown.tolist(), values.tolist(), arrows.tolist(), colors.tolist()):
+                ax.annotate(arrow, xy=(i, val), color=color, **arrow_style)
         
         ax.set_title('Cash Flow Trend Analysis', fontsize=16, fontweight='bold')
         ax.set_xlabel('Period', fontsize=12)
@@ -209,55 +391,53 @@ class FinancialVisualizer:
         ax.grid(axis='y', alpha=0.3)
         
         # Format y-axis with consistent currency formatting
-        ax.yaxis.set_major_formatter(self.currency_formatter)
+        ax.yaxis.set_major_formatter(self.CURRENCY_FORMATTER)
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_forecast_combined(self, forecast_data: pd.DataFrame,
-                                save_path: Optional[str] = None) -> plt.Figure:
+                                save_path: Optional[str] = None,
+                                ax: Optional[plt.Axes] = None) -> plt.Figure:
         """
         Enhanced forecast chart with consistent bar visualization.
         Historical and forecast both shown as bars with different colors.
         Confidence interval shown as error bars on forecast.
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
-        
-        historical = forecast_data[forecast_data['Type'] == 'Historical'].copy()
-        future = forecast_data[forecast_data['Type'] == 'Forecast'].copy()
+        fig, ax = self._figure((14, 7), ax)
         
-        n_hist = len(historical)
-        n_future = len(future)
+        historical, future = self._split_forecast(forecast_data)
+        hist_vals = historical['Forecast'].to_numpy()
+        fut_vals = future['Forecast'].to_numpy()
+        n_hist, n_future = hist_vals.size, fut_vals.size
         
         # Historical as bars
         if n_hist > 0:
-            hist_x = range(n_hist)
-            ax.bar(hist_x, historical['Forecast'], 
+            ax.bar(np.arange(n_hist), hist_vals, 
                   color=config.COLOR_PALETTE['primary'], 
-                  alpha=0.85, label='Historical', width=0.7)
+                  alpha=0.85, label='Historical', width=0.7, rasterized=True)
         
         # Forecast as bars with error bars for confidence interval
         if n_future > 0:
-            future_x = range(n_hist, n_hist + n_future)
-            forecast_values = future['Forecast'].values
-            ci_lower = future['CI_Lower'].clip(lower=0).values
-            ci_upper = future['CI_Upper'].values
+            future_x = np.arange(n_hist, n_hist + n_future)
+            ci_lower = future['CI_Lower'].clip(lower=0).to_numpy()
+            ci_upper = future['CI_Upper'].to_numpy()
             
             # Calculate error bar sizes
-            yerr_lower = forecast_values - ci_lower
-            yerr_upper = ci_upper - forecast_values
+            yerr_lower = fut_vals - ci_lower
+            yerr_upper = ci_upper - fut_vals
             
-            ax.bar(future_x, forecast_values, 
+            ax.bar(future_x, fut_vals, 
                   color=config.COLOR_PALETTE['warning'], 
                   alpha=0.85, label='Forecast', width=0.7,
                   yerr=[yerr_lower, yerr_upper],
-                  capsize=5, error_kw={'elinewidth': 2, 'capthick': 2, 'alpha': 0.7})
+                  capsize=5, error_kw={'elinewidth': 2, 'capthick': 2, 'alpha': 0.7}, rasterized=True)
         
         # Labels
         all_labels = list(historical['Period']) + list(future['Period'])
-        ax.set_xticks(range(len(all_labels)))
+        ax.set_xticks(np.arange(n_hist + n_future))
         ax.set_xticklabels(all_labels, rotation=45, ha='right')
         
         # Vertical line separating historical from forecast
@@ -271,50 +451,44 @@ class FinancialVisualizer:
         ax.set_ylabel('Cash Inflow ($)', fontsize=12)
         ax.legend(loc='upper left', fontsize=11)
         ax.grid(axis='y', alpha=0.3)
-        ax.yaxis.set_major_formatter(self.currency_formatter)
+        ax.yaxis.set_major_formatter(self.CURRENCY_FORMATTER)
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_forecast_line(self, forecast_data: pd.DataFrame,
-                            save_path: Optional[str] = None) -> plt.Figure:
+                            save_path: Optional[str] = None,
+                            ax: Optional[plt.Axes] = None) -> plt.Figure:
         """
         Forecast chart using consistent LINE chart for all data.
         Historical and forecast shown as continuous line with markers.
         Confidence interval shown as shaded region.
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        fig, ax = self._figure((14, 7), ax)
         
-        historical = forecast_data[forecast_data['Type'] == 'Historical'].copy()
-        future = forecast_data[forecast_data['Type'] == 'Forecast'].copy()
-        
-        n_hist = len(historical)
-        n_future = len(future)
+        historical, future = self._split_forecast(forecast_data)
+        hist_vals = historical['Forecast'].to_numpy()
+        fut_vals = future['Forecast'].to_numpy()
+        n_hist, n_future = hist_vals.size, fut_vals.size
         
         # Historical as line
         if n_hist > 0:
-            hist_x = list(range(n_hist))
-            ax.plot(hist_x, historical['Forecast'], 
+            ax.plot(np.arange(n_hist), hist_vals, 
                    marker='o', linewidth=2.5, markersize=8,
                    color=config.COLOR_PALETTE['primary'], 
                    label='Historical')
         
         # Forecast as line with confidence interval
         if n_future > 0:
-            # Connect historical to forecast with a line segment
-            future_x = list(range(n_hist - 1, n_hist + n_future)) if n_hist > 0 else list(range(n_future))
-            
-            # Include last historical point for continuity
-            if n_hist > 0:
-                forecast_line = [historical['Forecast'].iloc[-1]] + list(future['Forecast'])
-                ci_lower = [historical['Forecast'].iloc[-1]] + list(future['CI_Lower'].clip(lower=0))
-                ci_upper = [historical['Forecast'].iloc[-1]] + list(future['CI_Upper'])
-            else:
-                forecast_line = list(future['Forecast'])
-                ci_lower = list(future['CI_Lower'].clip(lower=0))
-                ci_upper = list(future['CI_Upper'])
+            # Lead with the last historical point (none if there is no history)
+            # so the forecast line and band connect to the historical line
+            lead = hist_vals[-1:]
+            future_x = np.arange(n_hist - lead.size, n_hist + n_future)
+            forecast_line = np.concatenate([lead, fut_vals])
+            ci_lower = np.concatenate([lead, np.maximum(future['CI_Lower'].to_numpy(), 0)])
+            ci_upper = np.concatenate([lead, future['CI_Upper'].to_numpy()])
             
             ax.plot(future_x, forecast_line, 
                    marker='D', linewidth=2.5, markersize=8,
@@ -324,11 +498,11 @@ class FinancialVisualizer:
             # Confidence interval as shaded region
             ax.fill_between(future_x, ci_lower, ci_upper,
                           alpha=0.25, color=config.COLOR_PALETTE['warning'],
-                          label='95% Confidence Interval')
+                          label='95% Confidence Interval', rasterized=True)
         
         # Labels
         all_labels = list(historical['Period']) + list(future['Period'])
-        ax.set_xticks(range(len(all_labels)))
+        ax.set_xticks(np.arange(n_hist + n_future))
         ax.set_xticklabels(all_labels, rotation=45, ha='right')
         
         # Vertical line separating historical from forecast
@@ -342,11 +516,11 @@ class FinancialVisualizer:
         ax.set_ylabel('Cash Inflow ($)', fontsize=12)
         ax.legend(loc='upper left', fontsize=11)
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(self.currency_formatter)
+        ax.yaxis.set_major_formatter(self.CURRENCY_FORMATTER)
         
-        plt.tight_layout()
+        fig.tight_layout()
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig
     
     def plot_predictive_dashboard(self, trend_data: pd.DataFrame,
@@ -357,13 +531,13 @@ class FinancialVisualizer:
         Create a 2x2 dashboard for predictive analytics.
         Shows: Trend, Forecast, At-Risk Clients, Summary Stats.
         """
-        fig = plt.figure(figsize=(16, 12))
+        fig = _pyplot().figure(figsize=(16, 12))
         
         # 1. Trend with Moving Average (top-left)
         ax1 = fig.add_subplot(2, 2, 1)
         if len(trend_data) > 0:
             x = range(len(trend_data))
-            ax1.bar(x, trend_data['Value'], color=config.COLOR_PALETTE['secondary'], alpha=0.7, width=0.6)
+            ax1.bar(x, trend_data['Value'], color=config.COLOR_PALETTE['secondary'], alpha=0.7, width=0.6, rasterized=True)
             if 'MovingAverage' in trend_data.columns:
                 ax1.plot(x, trend_data['MovingAverage'], marker='o', linewidth=2.5, 
                         color=config.COLOR_PALETTE['danger'], label='MA')
@@ -375,17 +549,19 @@ class FinancialVisualizer:
         
         # 2. Forecast Chart (top-right)
         ax2 = fig.add_subplot(2, 2, 2)
-        historical = forecast_data[forecast_data['Type'] == 'Historical']
-        future = forecast_data[forecast_data['Type'] == 'Forecast']
-        if len(historical) > 0:
-            ax2.bar(range(len(historical)), historical['Forecast'], 
-                   color=config.COLOR_PALETTE['primary'], alpha=0.8, label='Historical')
-        if len(future) > 0:
-            future_x = range(len(historical), len(historical) + len(future))
-            ax2.plot(future_x, future['Forecast'], marker='D', linewidth=2.5,
+        historical, future = self._split_forecast(forecast_data)
+        hist_vals = historical['Forecast'].to_numpy()
+        fut_vals = future['Forecast'].to_numpy()
+        n_hist, n_future = hist_vals.size, fut_vals.size
+        if n_hist > 0:
+            ax2.bar(np.arange(n_hist), hist_vals, 
+                   color=config.COLOR_PALETTE['primary'], alpha=0.8, label='Historical', rasterized=True)
+        if n_future > 0:
+            future_x = np.arange(n_hist, n_hist + n_future)
+            ax2.plot(future_x, fut_vals, marker='D', linewidth=2.5,
                     color=config.COLOR_PALETTE['warning'], label='Forecast')
-            ax2.fill_between(future_x, future['CI_Lower'].clip(lower=0), future['CI_Upper'],
-                           alpha=0.2, color=config.COLOR_PALETTE['warning'])
+            ax2.fill_between(future_x, future['CI_Lower'].clip(lower=0).to_numpy(), future['CI_Upper'].to_numpy(),
+                           alpha=0.2, color=config.COLOR_PALETTE['warning'], rasterized=True)
         ax2.set_title('Cash Inflow Forecast', fontweight='bold')
         ax2.legend()
         ax2.grid(axis='y', alpha=0.3)
@@ -395,7 +571,7 @@ class FinancialVisualizer:
         if at_risk_clients is not None and len(at_risk_clients) > 0:
             risk_data = at_risk_clients.head(10)
             colors = ['#ff6b6b' if r == 'High' else '#ffd93d' for r in risk_data['RiskLevel']]
-            ax3.barh(risk_data['ClientName'], risk_data['RiskProbability'] * 100, color=colors)
+            ax3.barh(risk_data['ClientName'], risk_data['RiskProbability'] * 100, color=colors, rasterized=True)
             ax3.set_xlabel('Risk Probability (%)')
             ax3.set_title('Top At-Risk Clients', fontweight='bold')
         else:
@@ -409,13 +585,18 @@ class FinancialVisualizer:
         
         # Calculate summary stats
         if len(trend_data) > 0:
-            latest_val = trend_data['Value'].iloc[-1] if 'Value' in trend_data.columns else 0
-            avg_val = trend_data['Value'].mean() if 'Value' in trend_data.columns else 0
-            trend_dir = trend_data['Trend'].iloc[-1] if 'Trend' in trend_data.columns else 'N/A'
+            # Plain array reads; NaN is skipped in the mean as Series.mean does
+            if 'Value' in trend_data.columns:
+                values = trend_data['Value'].to_numpy(dtype=float, na_value=np.nan)
+                latest_val = values[-1]
+                avg_val = np.nanmean(values) if not np.isnan(values).all() else np.nan
+            else:
+                latest_val, avg_val = 0, 0
+            trend_dir = trend_data['Trend'].to_numpy()[-1] if 'Trend' in trend_data.columns else 'N/A'
         else:
             latest_val, avg_val, trend_dir = 0, 0, 'N/A'
         
-        n_forecast = len(future) if len(future) > 0 else 0
+        n_forecast = n_future
         n_at_risk = len(at_risk_clients) if at_risk_clients is not None else 0
         
         summary_text = f"""
@@ -435,9 +616,9 @@ class FinancialVisualizer:
                 verticalalignment='center', fontfamily='monospace',
                 bbox=dict(boxstyle='round', facecolor='#f8f9fa', edgecolor='#dee2e6'))
         
-        plt.suptitle('Financial Predictive Analytics Dashboard', fontsize=18, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        fig.suptitle('Financial Predictive Analytics Dashboard', fontsize=18, fontweight='bold', y=1.02)
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
         return fig